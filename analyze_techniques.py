@@ -2,43 +2,139 @@
 """Analyze current techniques against allowed list."""
 import os
 import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
+_RE_PAREN = re.compile(r'\s*\([^)]+\)')
+_RE_NONWORD = re.compile(r'[^\w]+')
+_RE_UNDERS = re.compile(r'_+')
+
+# Test/demo technique files that should always be removed
+_BLACKLIST = frozenset({
+    'template_technique',
+    'demo_fixed_chunker',
+    'echo_technique',
+    'null_technique',
+    'dummy_dense',
+})
+
 
 def parse_allowed_techniques(file_path):
     """Parse RAG_techniques.txt to get canonical technique names."""
-    allowed = set()
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('- '):
-                # Remove the "- " prefix
-                technique = line[2:].strip()
-                allowed.add(technique)
-    return allowed
+    text = Path(file_path).read_text(encoding='utf-8')
+    # Keep non-empty "- " bullet lines (indented or not) and drop the prefix
+    names = {
+        line[2:].strip()
+        for line in map(str.strip, text.splitlines())
+        if line.startswith('- ')
+    }
+    names.discard('')
+    return names
 
 
+@lru_cache(maxsize=None)
 def normalize_name(technique_name):
     """Convert technique name to potential filename."""
     # Handle parenthetical descriptions
-    name = re.sub(r'\s*\([^)]+\)', '', technique_name)
+    name = _RE_PAREN.sub('', technique_name)
     # Convert to lowercase and replace spaces/special chars with underscores
-    name = re.sub(r'[^\w]+', '_', name.lower())
+    name = _RE_NONWORD.sub('_', name.lower())
     # Remove leading/trailing underscores and collapse multiple underscores
-    name = re.sub(r'_+', '_', name).strip('_')
+    name = _RE_UNDERS.sub('_', name).strip('_')
     return name
 
 
 def get_current_techniques():
     """Get current technique files in raglib/techniques/."""
-    techniques_dir = Path("raglib/techniques")
-    current = []
-    for py_file in techniques_dir.glob("*.py"):
-        if py_file.name != "__init__.py":
-            current.append(py_file.stem)
+    with os.scandir("raglib/techniques") as entries:
+        current = [
+            entry.name[:-3]
+            for entry in entries
+            if entry.is_file()
+            and entry.name.endswith(".py")
+            and entry.name != "__init__.py"
+        ]
     return current
 
 
+def write_lines(lines):
+    """Write lines to stdout with a single write call."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
+def format_originals(originals):
+    """Format the original technique names behind a normalized name."""
+    return " / ".join(f"'{orig}'" for orig in originals)
+
+
+def build_token_index(normalized_names):
+    """Map each underscore-separated token to the normalized names using it."""
+    token_index = defaultdict(list)
+    for norm_name in normalized_names:
+        for token in norm_name.split('_'):
+            token_index[token].append(norm_name)
+    return token_index
+
+
+def build_trie(names, reverse=False):
+    """Build a character trie of names (reversed for suffix lookups).
+
+    Each node is a dict keyed by character; the ``None`` key marks the end
+    of a name and holds the original (unreversed) name.
+    """
+    trie = {}
+    for name in names:
+        node = trie
+        for ch in (name[::-1] if reverse else name):
+            node = node.setdefault(ch, {})
+        node[None] = name
+    return trie
+
+
+def trie_match(trie, s):
+    """Return a name that is a prefix of ``s`` or has ``s`` as a prefix."""
+    node = trie
+    best = None
+    for ch in s:
+        node = node.get(ch)
+        if node is None:
+            return best
+        best = node.get(None, best)
+    if best is not None:
+        return best
+    # s is a prefix of at least one name: walk down to any of them
+    while None not in node:
+        node = next(iter(node.values()))
+    return node[None]
+
+
+def find_fuzzy_match(current_file, normalized_names, token_index,
+                     prefix_trie, suffix_trie):
+    """Find a normalized name that contains, or is contained in, current_file.
+
+    Names sharing an underscore token with ``current_file`` are checked
+    first, then names that are a prefix/suffix of it (or vice versa). The
+    full containment scan runs last, for substrings in the middle of a name.
+    """
+    candidates = set().union(
+        *(token_index[t] for t in current_file.split('_') if t in token_index)
+    )
+    for norm_name in sorted(candidates):
+        if current_file in norm_name or norm_name in current_file:
+            return norm_name
+    match = trie_match(prefix_trie, current_file)
+    if match is None:
+        match = trie_match(suffix_trie, current_file[::-1])
+    if match is not None:
+        return match
+    for norm_name in normalized_names:
+        if current_file in norm_name or norm_name in current_file:
+            return norm_name
+    return None
+
+
 def main():
     # Parse allowed techniques
     allowed_file = Path("../RAG_techniques.txt")
@@ -47,17 +143,17 @@ def main():
         return
     
     allowed = parse_allowed_techniques(allowed_file)
+    sorted_allowed = sorted(allowed)
     print(f"Found {len(allowed)} allowed techniques:")
-    for tech in sorted(allowed):
-        print(f"  - {tech}")
+    write_lines(f"  - {tech}" for tech in sorted_allowed)
     
     print()
     
     # Get current implementations
     current = get_current_techniques()
+    sorted_current = sorted(current)
     print(f"Current technique files ({len(current)}):")
-    for tech in sorted(current):
-        print(f"  - {tech}.py")
+    write_lines(f"  - {tech}.py" for tech in sorted_current)
     
     print()
     
@@ -65,63 +161,66 @@ def main():
     print("Analysis:")
     print("=========")
     
-    # Create mapping from normalized names to original names
-    allowed_normalized = {}
-    for tech in allowed:
-        norm = normalize_name(tech)
-        if norm in allowed_normalized:
-            print(f"WARNING: Normalized name collision: '{norm}' for both '{tech}' and '{allowed_normalized[norm]}'")
-        allowed_normalized[norm] = tech
+    # Create mapping from normalized names to original names; collisions
+    # keep every original name instead of overwriting the previous one
+    allowed_normalized = defaultdict(list)
+    for tech in sorted_allowed:
+        allowed_normalized[normalize_name(tech)].append(tech)
+    for norm, origs in allowed_normalized.items():
+        if len(origs) > 1:
+            print(f"WARNING: Normalized name collision: '{norm}' for {format_originals(origs)}")
     
+    token_index = build_token_index(allowed_normalized)
+    prefix_trie = build_trie(allowed_normalized)
+    suffix_trie = build_trie(allowed_normalized, reverse=True)
+
     # Check current files against allowed
     to_remove = []
     to_keep = []
     to_rename = []
     
-    for current_file in current:
-        if current_file in ['template_technique', 'demo_fixed_chunker', 'echo_technique', 'null_technique', 'dummy_dense']:
+    for current_file in sorted_current:
+        if current_file in _BLACKLIST:
             # These are clearly test/demo files
             to_remove.append(current_file)
         elif current_file in allowed_normalized:
             to_keep.append((current_file, allowed_normalized[current_file]))
         else:
             # Try to find a match by fuzzy matching
-            found_match = False
-            for norm_name, orig_name in allowed_normalized.items():
-                if current_file in norm_name or norm_name in current_file:
-                    to_rename.append((current_file, norm_name, orig_name))
-                    found_match = True
-                    break
-            if not found_match:
+            match = find_fuzzy_match(
+                current_file, allowed_normalized, token_index,
+                prefix_trie, suffix_trie
+            )
+            if match is not None:
+                to_rename.append((current_file, match, allowed_normalized[match]))
+            else:
                 to_remove.append(current_file)
     
     print(f"\nFiles to REMOVE ({len(to_remove)}):")
-    for f in to_remove:
-        print(f"  - {f}.py")
+    write_lines(f"  - {f}.py" for f in to_remove)
     
     print(f"\nFiles to KEEP ({len(to_keep)}):")
-    for f, orig in to_keep:
-        print(f"  - {f}.py -> '{orig}'")
+    write_lines(
+        f"  - {f}.py -> {format_originals(origs)}" for f, origs in to_keep
+    )
     
     print(f"\nFiles to potentially RENAME ({len(to_rename)}):")
-    for f, norm, orig in to_rename:
-        print(f"  - {f}.py -> {norm}.py ('{orig}')")
+    write_lines(
+        f"  - {f}.py -> {norm}.py ({format_originals(origs)})"
+        for f, norm, origs in to_rename
+    )
     
     # Check for missing implementations
-    missing = []
-    implemented_normalized = set()
-    for f, _ in to_keep:
-        implemented_normalized.add(f)
-    for f, norm, _ in to_rename:
-        implemented_normalized.add(norm)
-    
-    for norm_name, orig_name in allowed_normalized.items():
-        if norm_name not in implemented_normalized:
-            missing.append((norm_name, orig_name))
+    implemented_normalized = (
+        {f for f, _ in to_keep} | {norm for _, norm, _ in to_rename}
+    )
+    missing_norms = allowed_normalized.keys() - implemented_normalized
+    missing = [(norm, allowed_normalized[norm]) for norm in sorted(missing_norms)]
     
     print(f"\nMISSING implementations ({len(missing)}):")
-    for norm, orig in missing:
-        print(f"  - {norm}.py for '{orig}'")
+    write_lines(
+        f"  - {norm}.py for {format_originals(origs)}" for norm, origs in missing
+    )
 
 
 if __name__ == "__main__":
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 # Quick test of technique registration
-from raglib.techniques.fixed_size_chunker import FixedSizeChunker
-from raglib.techniques.sentence_window_chunker import SentenceWindowChunker
-from raglib.techniques.semantic_chunker import SemanticChunker
+import sys
+
 from raglib.registry import TechniqueRegistry
 
+# The registry imports the built-in technique modules on first lookup
+registry = TechniqueRegistry.list()
+
 print('New chunking techniques registered:')
-for name, cls in TechniqueRegistry.list().items():
-    if 'chunk' in name.lower():
-        print(f'  - {name}: {cls.__name__}')
+sys.stdout.write(''.join(
+    f'  - {name}: {cls.__name__}\n'
+    for name, cls in registry.items()
+    if 'chunk' in name.lower()
+))
 
 required = ['fixed_size_chunker', 'sentence_window_chunker', 'semantic_chunker']
-all_registered = all(name in TechniqueRegistry.list() for name in required)
+all_registered = all(name in registry for name in required)
 print(f'\nAll required techniques registered: {all_registered}')
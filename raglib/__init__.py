@@ -21,6 +21,6 @@ __author__ = "RAGLib Contributors"
 __email__ = "contributors@raglib.org"
 __license__ = "MIT"
 
-# Import techniques to ensure they are registered
-# This triggers the @TechniqueRegistry.register decorators
+# Technique modules are imported lazily; TechniqueRegistry loads them on the
+# first lookup, which triggers the @TechniqueRegistry.register decorators
 from . import techniques  # noqa: F401
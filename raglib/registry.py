@@ -7,8 +7,21 @@ class TechniqueRegistry:
     """Registry for RAGTechnique classes.
 
     Register technique classes with the `@TechniqueRegistry.register` decorator.
+    Built-in techniques are imported on the first lookup, or before the first
+    user registration so that user classes can override built-in names.
     """
     _registry: Dict[str, Type[RAGTechnique]] = {}
+    _builtins_loaded: bool = False
+
+    @classmethod
+    def _load_builtins(cls) -> None:
+        """Import the built-in technique modules once so they register."""
+        if cls._builtins_loaded:
+            return
+        cls._builtins_loaded = True
+        from . import techniques
+
+        techniques.register_all()
 
     @classmethod
     def register(cls, klass: Type[RAGTechnique]) -> Type[RAGTechnique]:
@@ -32,19 +45,28 @@ class TechniqueRegistry:
             category = getattr(meta, "category", None)
         if not name:
             raise ValueError("Technique 'meta' must have a 'name' attribute.")
+        # load built-ins first so they can never overwrite a user class later
+        if not cls._builtins_loaded and not klass.__module__.startswith(
+            f"{__package__}.techniques."
+        ):
+            cls._load_builtins()
         cls._registry[name] = klass
         return klass
 
     @classmethod
     def get(cls, name: str) -> Type[RAGTechnique]:
+        if name not in cls._registry:
+            cls._load_builtins()
         return cls._registry[name]
 
     @classmethod
     def list(cls) -> Dict[str, Type[RAGTechnique]]:
+        cls._load_builtins()
         return dict(cls._registry)
 
     @classmethod
     def find_by_category(cls, category: str) -> Dict[str, Type[RAGTechnique]]:
+        cls._load_builtins()
         return {
             name: klass
             for name, klass in cls._registry.items()
@@ -1,4 +1,7 @@
 # techniques package — updated to include production-friendly technique modules
+import importlib
+from typing import Any
+
 __all__ = [
     "bm25",
     "tfidf",
@@ -24,26 +27,49 @@ __all__ = [
     "hyde",
 ]
 
-# convenient imports (optional)
-from .bm25 import BM25  # noqa: F401
-from .colbert_retriever import ColBERTRetriever  # noqa: F401
-from .content_aware_chunker import ContentAwareChunker  # noqa: F401
-from .crossencoder_rerank import CrossEncoderReRanker  # noqa: F401
-from .dense_retriever import DenseRetriever  # noqa: F401
-from .document_specific_chunker import DocumentSpecificChunker  # noqa: F401
-from .dual_encoder import DualEncoder  # noqa: F401
-from .faiss_retriever import FAISSRetriever  # noqa: F401
-from .fixed_size_chunker import FixedSizeChunker  # noqa: F401
-from .hyde import HyDE  # noqa: F401
-from .lexical_matcher import LexicalMatcher  # noqa: F401
-from .lexical_transformer import LexicalTransformer  # noqa: F401
-from .mmr import MMRReRanker  # noqa: F401
-from .multi_query_retriever import MultiQueryRetriever  # noqa: F401
-from .multi_vector_retriever import MultiVectorRetriever  # noqa: F401
-from .parent_document_chunker import ParentDocumentChunker  # noqa: F401
-from .propositional_chunker import PropositionalChunker  # noqa: F401
-from .recursive_chunker import RecursiveChunker  # noqa: F401
-from .semantic_chunker import SemanticChunker  # noqa: F401
-from .sentence_window_chunker import SentenceWindowChunker  # noqa: F401
-from .splade import Splade  # noqa: F401
-from .tfidf import TfIdf  # noqa: F401
+# convenient imports (optional), resolved lazily on first attribute access
+_LAZY = {
+    "BM25": ".bm25",
+    "ColBERTRetriever": ".colbert_retriever",
+    "ContentAwareChunker": ".content_aware_chunker",
+    "CrossEncoderReRanker": ".crossencoder_rerank",
+    "DenseRetriever": ".dense_retriever",
+    "DocumentSpecificChunker": ".document_specific_chunker",
+    "DualEncoder": ".dual_encoder",
+    "FAISSRetriever": ".faiss_retriever",
+    "FixedSizeChunker": ".fixed_size_chunker",
+    "HyDE": ".hyde",
+    "LexicalMatcher": ".lexical_matcher",
+    "LexicalTransformer": ".lexical_transformer",
+    "MMRReRanker": ".mmr",
+    "MultiQueryRetriever": ".multi_query_retriever",
+    "MultiVectorRetriever": ".multi_vector_retriever",
+    "ParentDocumentChunker": ".parent_document_chunker",
+    "PropositionalChunker": ".propositional_chunker",
+    "RecursiveChunker": ".recursive_chunker",
+    "SemanticChunker": ".semantic_chunker",
+    "SentenceWindowChunker": ".sentence_window_chunker",
+    "Splade": ".splade",
+    "TfIdf": ".tfidf",
+}
+
+
+def register_all() -> None:
+    """Import every built-in technique module so its decorator registers it."""
+    for module in _LAZY.values():
+        importlib.import_module(module, __name__)
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY) | set(__all__))
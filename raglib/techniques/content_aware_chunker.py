@@ -7,6 +7,11 @@ from ..core import RAGTechnique, TechniqueMeta, TechniqueResult
 from ..registry import TechniqueRegistry
 from ..schemas import Chunk, Document
 
+# Natural boundary patterns used by _find_natural_boundaries
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+_HEADING_RE = re.compile(r'\n(#{1,6}\s+.+|[A-Z\s]{5,})\n')
+_SENTENCE_RE = re.compile(r'[.!?]+\s+')
+
 
 @TechniqueRegistry.register
 class ContentAwareChunker(RAGTechnique):
@@ -48,18 +53,15 @@ class ContentAwareChunker(RAGTechnique):
         boundaries = [0]  # Start of text
 
         # Find paragraph boundaries (double newlines)
-        paragraph_pattern = r'\n\s*\n'
-        for match in re.finditer(paragraph_pattern, text):
+        for match in _PARAGRAPH_RE.finditer(text):
             boundaries.append(match.end())
 
         # Find heading boundaries (lines starting with #, or all caps lines)
-        heading_pattern = r'\n(#{1,6}\s+.+|[A-Z\s]{5,})\n'
-        for match in re.finditer(heading_pattern, text):
+        for match in _HEADING_RE.finditer(text):
             boundaries.append(match.start() + 1)
 
         # Find sentence boundaries
-        sentence_pattern = r'[.!?]+\s+'
-        for match in re.finditer(sentence_pattern, text):
+        for match in _SENTENCE_RE.finditer(text):
             boundaries.append(match.end())
 
         # Add end of text
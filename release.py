@@ -12,6 +12,7 @@ Usage:
     python release.py minor    # 1.0.0 -> 1.1.0
     python release.py major    # 1.0.0 -> 2.0.0
     python release.py 1.2.3    # Set specific version
+    python release.py 1.2.3 --retag  # Tag the current (unchanged) version if untagged
 """
 
 import re
@@ -19,39 +20,45 @@ import subprocess
 import sys
 from pathlib import Path
 
-try:
-    import toml
-except ImportError:
-    print("❌ Error: toml package not found. Install with: pip install toml")
-    sys.exit(1)
+PYPROJECT = Path("pyproject.toml")
+
+# Matches the top-level ``version = "..."`` line of the [project] table
+_VERSION_RE = re.compile(r'(?m)^version\s*=\s*"[^"]+"')
 
 
 def get_current_version() -> str:
     """Get current version from pyproject.toml."""
-    pyproject_path = Path("pyproject.toml")
-    if not pyproject_path.exists():
+    if not PYPROJECT.exists():
         raise FileNotFoundError("pyproject.toml not found")
     
-    with open(pyproject_path) as f:
-        data = toml.load(f)
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError(
+                "tomli package not found. Install with: pip install tomli"
+            ) from None
+
+    with open(PYPROJECT, "rb") as f:
+        data = tomllib.load(f)
     
     return data["project"]["version"]
 
 
 def set_version(new_version: str) -> None:
     """Update version in pyproject.toml."""
-    pyproject_path = Path("pyproject.toml")
-    
-    with open(pyproject_path) as f:
-        content = f.read()
+    content = PYPROJECT.read_text(encoding="utf-8")
     
-    # Update version line
-    pattern = r'version = "[^"]+"'
-    replacement = f'version = "{new_version}"'
-    new_content = re.sub(pattern, replacement, content)
+    # Update only the first version line
+    new_content, count = _VERSION_RE.subn(
+        f'version = "{new_version}"', content, count=1
+    )
+    if count != 1:
+        raise ValueError("Version line not found in pyproject.toml")
     
-    with open(pyproject_path, "w") as f:
-        f.write(new_content)
+    PYPROJECT.write_text(new_content, encoding="utf-8")
     
     print(f"✅ Updated pyproject.toml version to {new_version}")
 
@@ -74,14 +81,23 @@ def bump_version(current: str, bump_type: str) -> str:
         raise ValueError(f"Invalid bump type: {bump_type}")
 
 
-def run_command(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run shell command."""
+def run_command(
+    argv: list[str], check: bool = True, capture: bool = False
+) -> subprocess.CompletedProcess:
+    """Run a command without a shell.
+
+    Output goes straight to the terminal unless ``capture`` is set, in which
+    case stdout/stderr are returned on the result.
+    """
+    cmd = " ".join(argv)
     print(f"🔄 Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    pipe = subprocess.PIPE if capture else None
+    result = subprocess.run(argv, stdout=pipe, stderr=pipe, text=True)
     
     if check and result.returncode != 0:
         print(f"❌ Command failed: {cmd}")
-        print(f"Error: {result.stderr}")
+        if capture:
+            print(f"Error: {result.stderr}")
         sys.exit(1)
     
     return result
@@ -89,33 +105,48 @@ def run_command(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
 
 def is_git_clean() -> bool:
     """Check if git working directory is clean."""
-    result = run_command("git status --porcelain", check=False)
+    result = run_command(["git", "status", "--porcelain"], check=False, capture=True)
     return result.stdout.strip() == ""
 
 
+def tag_exists(tag_name: str) -> bool:
+    """Check if a git tag already exists locally."""
+    result = run_command(
+        ["git", "rev-parse", "-q", "--verify", f"refs/tags/{tag_name}"],
+        check=False, capture=True,
+    )
+    return result.returncode == 0
+
+
 def create_and_push_tag(version: str, push: bool = True) -> None:
     """Create and optionally push git tag."""
     tag_name = f"v{version}"
     
     # Create tag
-    run_command(f'git tag -a {tag_name} -m "Release {tag_name}"')
+    run_command(["git", "tag", "-a", tag_name, "-m", f"Release {tag_name}"])
     print(f"✅ Created tag: {tag_name}")
     
     if push:
-        # Push tag
-        run_command(f"git push origin {tag_name}")
-        print(f"✅ Pushed tag: {tag_name}")
+        # Push the branch and its annotated tag in one go
+        run_command(
+            ["git", "push", "--atomic", "origin", "main", f"refs/tags/{tag_name}"]
+        )
+        print(f"✅ Pushed main and tag: {tag_name}")
         print("🚀 GitHub Actions will now handle the release automatically!")
         print("📋 Monitor progress at: "
               "https://github.com/Mohammadshamlawi/raglib/actions")
 
 
 def main():
-    if len(sys.argv) != 2:
+    args = sys.argv[1:]
+    retag = "--retag" in args
+    if retag:
+        args.remove("--retag")
+    if len(args) != 1:
         print(__doc__)
         sys.exit(1)
     
-    bump_arg = sys.argv[1]
+    bump_arg = args[0]
     
     # Check if git working directory is clean
     if not is_git_clean():
@@ -141,25 +172,38 @@ def main():
         
         print(f"🎯 New version: {new_version}")
         
+        unchanged = new_version == current_version
+        if unchanged and not retag:
+            print(f"❌ Version is already {new_version}. "
+                  "Use --retag to tag it without bumping.")
+            sys.exit(1)
+        if unchanged and tag_exists(f"v{new_version}"):
+            print(f"❌ Tag v{new_version} already exists; nothing to tag.")
+            sys.exit(1)
+        
         # Confirm with user
         response = input(f"Continue with release {new_version}? [y/N]: ")
         if response.lower() not in ["y", "yes"]:
             print("❌ Release cancelled.")
             sys.exit(0)
         
+        # Same version: nothing to bump or commit, only create the tag
+        if unchanged:
+            print("ℹ️  Version unchanged; tagging only")
+            create_and_push_tag(new_version)
+            return
+        
         # Update version
         set_version(new_version)
         
-        # Commit version change
-        run_command("git add pyproject.toml")
-        run_command(f'git commit -m "Bump version to {new_version}"')
+        # Commit version change (pyproject.toml is tracked, so no add step)
+        run_command([
+            "git", "commit", "-m", f"Bump version to {new_version}",
+            "--", "pyproject.toml",
+        ])
         print("✅ Committed version change")
         
-        # Push changes
-        run_command("git push origin main")
-        print("✅ Pushed version change")
-        
-        # Create and push tag
+        # Create tag and push it together with the version commit
         create_and_push_tag(new_version)
         
         print("\n" + "="*50)
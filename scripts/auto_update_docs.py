@@ -20,28 +20,413 @@ Features:
 """
 
 import argparse
+import contextlib
+import hashlib
+import importlib
+import inspect
 import json
+import os
 import re
 import sys
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import subprocess
 import time
 from dataclasses import dataclass
 
+from site_build import site_is_current, site_needs_full_build, write_build_stamp
+
+# Add raglib to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_registry():
+    """Import raglib and its techniques on first use; exit if unavailable."""
+    try:
+        from raglib.registry import TechniqueRegistry
+        # Import all techniques to ensure registration
+        import raglib.techniques  # noqa: F401
+    except ImportError as e:
+        print(f"❌ Failed to import raglib: {e}")
+        print("Make sure you're running from the project root and raglib is installed")
+        sys.exit(1)
+    return TechniqueRegistry
+
+
+# Section patterns used when rewriting the documentation files
+_CHUNKING_HEADER = '### Chunking Techniques'
+_README_DOCPROC_RE = re.compile(r'(### 🔨 Document Processing\s*\n)(- \*\*.*?\n)*')
+
+# Templates for the generated example scripts. Both share _SCRIPT_HEADER,
+# filled with str.format; the bodies and footer are plain text.
+_SCRIPT_HEADER = '''#!/usr/bin/env python3
+"""
+{docstring}
+
+Generated on: {generated_on}
+"""
+
+{stdlib_imports}
 # Add raglib to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 try:
-    from raglib.registry import TechniqueRegistry
-    from raglib.core import TechniqueMeta
-    # Import all techniques to ensure registration
-    import raglib.techniques
-except ImportError as e:
-    print(f"❌ Failed to import raglib: {e}")
-    print("Make sure you're running from the project root and raglib is installed")
+    from raglib.techniques import (
+        {imports}
+    )
+    from raglib.schemas import Document
+{extra_imports}except ImportError as e:
+    print(f"Failed to import raglib: {{e}}")
     sys.exit(1)
+'''
+
+_BENCHMARK_DOCSTRING = '''Auto-generated Chunking Benchmark Script
+
+This script was automatically generated by the RAGLib documentation updater.
+It benchmarks all {count} available chunking techniques.'''
+
+_SHOWCASE_DOCSTRING = '''Auto-generated Chunking Showcase Script
+
+This script demonstrates all available chunking techniques with examples.
+Generated automatically by the RAGLib documentation updater.'''
+
+_BENCHMARK_SCRIPT_BODY = '''
+
+def main():
+    """Run comprehensive benchmark on all chunking techniques."""
+    print("🔬 Auto-Generated Chunking Benchmark")
+    print("=" * 50)
+    
+    # Get all chunking techniques
+    techniques = TechniqueRegistry.find_by_category("chunking")
+    print(f"📊 Testing {len(techniques)} chunking techniques")
+    
+    # Test document
+    test_doc = Document(
+        id="test_document",
+        text="""
+# Introduction
+
+This is a test document with various structures. It contains multiple paragraphs,
+different section headings, and various text patterns to test chunking strategies.
+
+## Section 1
+
+Here we have some content that spans multiple sentences. The goal is to see
+how different chunking techniques handle document structure and boundaries.
+
+### Subsection 1.1
+
+More detailed content with technical information. This section contains
+specific details that should ideally stay together for context preservation.
+
+## Section 2
+
+Different content with various formatting. Lists, code blocks, and other
+structural elements challenge chunking algorithms differently.
+
+- Item 1: First list item
+- Item 2: Second list item  
+- Item 3: Third list item
+
+### Code Example
+
+```python
+def example_function():
+    return "Hello, World!"
+```
+
+## Conclusion
+
+This document provides a comprehensive test case for evaluating chunking
+strategies across different text structures and patterns.
+        """,
+        meta={"type": "test", "structure": "hierarchical"}
+    )
+    
+    results = {}
+    
+    for name, technique_class in techniques.items():
+        print(f"\\n🔍 Testing: {name}")
+        
+        try:
+            # Initialize with default parameters
+            technique = technique_class()
+            
+            start_time = time.time()
+            result = technique.apply(test_doc)
+            end_time = time.time()
+            
+            if result.success:
+                # Handle different result formats
+                if name == "parent_document_chunker":
+                    payload = result.payload
+                    child_chunks = payload.get("child_chunks", [])
+                    parent_chunks = payload.get("parent_chunks", [])
+                    
+                    results[name] = {
+                        "success": True,
+                        "child_chunks": len(child_chunks),
+                        "parent_chunks": len(parent_chunks),
+                        "processing_time": end_time - start_time,
+                        "technique_class": technique_class.__name__
+                    }
+                    
+                    print(f"   ✅ {len(child_chunks)} child chunks, {len(parent_chunks)} parent chunks")
+                else:
+                    chunks = result.payload.get("chunks", [])
+                    avg_length = sum(len(c.text) for c in chunks) / len(chunks) if chunks else 0
+                    
+                    results[name] = {
+                        "success": True,
+                        "num_chunks": len(chunks),
+                        "avg_chunk_length": avg_length,
+                        "processing_time": end_time - start_time,
+                        "technique_class": technique_class.__name__
+                    }
+                    
+                    print(f"   ✅ {len(chunks)} chunks, avg length: {avg_length:.0f} chars")
+            else:
+                results[name] = {
+                    "success": False,
+                    "error": result.error,
+                    "processing_time": end_time - start_time
+                }
+                print(f"   ❌ Failed: {result.error}")
+                
+        except Exception as e:
+            results[name] = {
+                "success": False,
+                "error": str(e),
+                "processing_time": 0
+            }
+            print(f"   💥 Exception: {e}")
+    
+    # Save results
+    output_file = Path(__file__).parent / "chunking_benchmark_results_auto.json"
+    with open(output_file, 'w') as f:
+        json.dump({
+            "timestamp": time.strftime('%Y-%m-%d %H:%M:%S'),
+            "total_techniques": len(techniques),
+            "results": results
+        }, f, indent=2)
+    
+    print(f"\\n💾 Results saved to: {output_file}")
+    
+    # Summary
+    successful = sum(1 for r in results.values() if r.get("success", False))
+    print(f"\\n📊 Summary: {successful}/{len(results)} techniques successful")
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+_SHOWCASE_SCRIPT_BODY = '''
+
+def main():
+    """Demonstrate all chunking techniques."""
+    print("🔬 RAGLib Chunking Techniques Showcase")
+    print("=" * 50)
+    
+    # Test document
+    document = Document(
+        id="showcase_doc",
+        text="""
+# Machine Learning Fundamentals
+
+## Introduction
+
+Machine learning is a subset of artificial intelligence that focuses on 
+algorithms that can learn and improve from experience.
+
+### Supervised Learning
+
+In supervised learning, algorithms learn from labeled training data.
+Common examples include:
+
+- Classification problems
+- Regression analysis
+- Pattern recognition
+
+### Unsupervised Learning
+
+Unsupervised learning finds hidden patterns in data without labels.
+This includes clustering and dimensionality reduction techniques.
+
+## Applications
+
+Machine learning has numerous real-world applications:
+
+1. Computer vision and image recognition
+2. Natural language processing
+3. Recommendation systems
+4. Autonomous vehicles
+
+## Conclusion
+
+Understanding these fundamentals provides a solid foundation for
+exploring more advanced machine learning concepts.
+        """,
+        meta={"type": "educational", "topic": "machine_learning"}
+    )
+    
+    # Initialize all techniques
+    techniques = [
+'''
+
+_SHOWCASE_SCRIPT_FOOTER = '''    ]
+    
+    print(f"Testing {len(techniques)} chunking techniques:")
+    print()
+    
+    for name, technique in techniques:
+        try:
+            result = technique.apply(document)
+            
+            if result.success:
+                if "Parent" in name:
+                    payload = result.payload
+                    child_count = len(payload.get("child_chunks", []))
+                    parent_count = len(payload.get("parent_chunks", []))
+                    print(f"✅ {name}: {child_count} child, {parent_count} parent chunks")
+                else:
+                    chunks = result.payload.get("chunks", [])
+                    if chunks:
+                        avg_length = sum(len(c.text) for c in chunks) / len(chunks)
+                        print(f"✅ {name}: {len(chunks)} chunks (avg: {avg_length:.0f} chars)")
+                        
+                        # Show first chunk preview
+                        if self.config.verbose and chunks:
+                            preview = chunks[0].text[:100].replace('\\n', ' ').strip()
+                            print(f"   Preview: {preview}...")
+                    else:
+                        print(f"✅ {name}: No chunks created")
+            else:
+                print(f"❌ {name}: {result.error}")
+                
+        except Exception as e:
+            print(f"💥 {name}: {e}")
+    
+    print("\\n🎉 Showcase complete!")
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+# README labels for chunking techniques, keyed by a keyword of the technique
+# name; checked in insertion order
+_README_LABELS = {
+    'fixed': 'Fixed Size Chunking',
+    'semantic': 'Semantic Chunking',
+    'sentence': 'Sentence Window Chunking',
+    'content': 'Content-Aware Chunking',
+    'document': 'Document-Specific Chunking',
+    'recursive': 'Recursive Chunking',
+    'propositional': 'Propositional Chunking',
+    'parent': 'Parent-Document Chunking',
+}
+
+_IO_BUFFER_SIZE = 1 << 16
+
+# Records the technique signature and source mtimes of the last update so
+# unchanged markdown files can be skipped without reading them, and the
+# input digest of each generated artifact so unchanged ones are not rebuilt
+_STATE_FILENAME = ".raglib_docs_state.json"
+
+# Markdown files tracked in the state file, as keys of ``_paths``
+_TRACKED_DOCS = ('techniques_md', 'getting_started_md', 'readme_md')
+
+def _read(path: Path) -> str:
+    """Read a UTF-8 text file through a 64 KiB buffer."""
+    with open(path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+        return f.read()
+
+
+def _write(path: Path, text: str) -> None:
+    """Write a UTF-8 text file through a 64 KiB buffer."""
+    with open(path, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+        f.write(text)
+
+
+# Generated scripts carry a timestamp that must not count as a change
+_GENERATED_ON_RE = re.compile(r'^Generated on: .*$', re.MULTILINE)
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write ``text`` to ``path`` unless the file already holds it.
+    
+    The ``Generated on:`` stamp is ignored in the comparison. Returns True
+    iff the file was written.
+    """
+    try:
+        on_disk = _read(path)
+    except OSError:
+        on_disk = None
+    if on_disk is not None and (
+        _GENERATED_ON_RE.sub('', on_disk) == _GENERATED_ON_RE.sub('', text)
+    ):
+        return False
+    
+    _write(path, text)
+    return True
+
+
+# Resolved (category, description, version, dependencies) per technique class
+_META_CACHE: Dict[int, Tuple[str, str, str, List[str]]] = {}
+
+
+def _find_chunking_section(content: str) -> Optional[Tuple[int, int]]:
+    """Locate the body of the chunking section in techniques.md.
+    
+    Returns ``(body_start, end)``: the body starts after the header and its
+    trailing blank lines and ends before the next ``##``/``###`` heading (or
+    the file's trailing newlines).
+    """
+    start = content.find(_CHUNKING_HEADER)
+    if start < 0:
+        return None
+    
+    header_end = start + len(_CHUNKING_HEADER)
+    ws_end = header_end
+    while ws_end < len(content) and content[ws_end].isspace():
+        ws_end += 1
+    newline = content.rfind('\n', header_end, ws_end)
+    if newline < 0:
+        return None
+    body_start = newline + 1
+    
+    end = min(
+        (i for i in (content.find('\n### ', body_start),
+                     content.find('\n## ', body_start)) if i >= 0),
+        default=len(content.rstrip('\n')),
+    )
+    return body_start, max(end, body_start)
+
+
+def _resolve_meta(meta) -> Tuple[str, str, str, List[str]]:
+    """Resolve the documented metadata fields of a technique.
+    
+    TechniqueMeta and legacy meta objects alike are read with ``getattr``,
+    so class-level and slot attributes are found too.
+    """
+    category = getattr(meta, 'category', 'unknown')
+    description = getattr(meta, 'description', 'No description available')
+    version = getattr(meta, 'version', '1.0.0')  # Default version
+    dependencies = getattr(meta, 'dependencies', [])
+    return category, description, version, dependencies
+
+
+@lru_cache(maxsize=None)
+def _constructor_parameters(technique_class) -> Tuple[str, ...]:
+    """Return the constructor parameter names of a technique class."""
+    sig = inspect.signature(technique_class.__init__)
+    return tuple(name for name in sig.parameters if name != 'self')
 
 
 @dataclass
@@ -54,6 +439,11 @@ class UpdateConfig:
     dry_run: bool = False
     verbose: bool = False
     force_rebuild: bool = False
+    only: Optional[Tuple[str, ...]] = None  # run just these UPDATE_STEPS
+
+
+# Steps that --only can select; technique discovery always runs
+UPDATE_STEPS = ('docs', 'index', 'benchmark', 'showcase', 'site', 'validate')
 
 
 class DocumentationUpdater:
@@ -63,6 +453,14 @@ class DocumentationUpdater:
         self.config = config
         self.techniques_data = None
         self.changes_made = []
+        self._sorted_by_category: Dict[str, List[Dict]] = {}
+        self._chunking_class_names: Tuple[str, ...] = ()
+        self._paths: Dict[str, Tuple[Path, bool]] = {}
+        self._state: Dict[str, Any] = {}
+        self._artifacts: Dict[str, str] = {}
+        self._index_inputs = ''
+        self._signature = ''
+        self._index_mtime_before: Optional[int] = None
         
     def run_full_update(self) -> bool:
         """Run the complete documentation update process."""
@@ -70,32 +468,51 @@ class DocumentationUpdater:
             print("🚀 RAGLib Documentation Auto-Updater")
             print("=" * 50)
             
+            self._paths = self._resolve_paths()
+            
+            # Create every output directory once up front; writes below
+            # assume they exist. site/ is left to mkdocs and tools/ is input.
+            if not self.config.dry_run:
+                for directory in {self.config.docs_dir, self.config.examples_dir}:
+                    directory.mkdir(parents=True, exist_ok=True)
+            
             # Step 1: Discover and analyze techniques
             self.log("📊 Discovering registered techniques...")
             self.techniques_data = self._discover_techniques()
             self._print_technique_summary()
+            self._signature = self._technique_signature()
+            self._state = self._load_state()
+            self._artifacts = dict(self._state.get('artifacts', {}))
             
             # Step 2: Update core documentation files
-            self.log("📝 Updating core documentation...")
-            self._update_techniques_md()
-            self._update_getting_started_md()
-            self._update_readme_md()
+            if self._wants('docs'):
+                self.log("📝 Updating core documentation...")
+                self._update_techniques_md()
+                self._update_getting_started_md()
+                self._update_readme_md()
             
             # Step 3: Generate auto-generated documentation
-            self.log("🔄 Regenerating auto-generated content...")
-            self._regenerate_techniques_index()
+            if self._wants('index'):
+                self.log("🔄 Regenerating auto-generated content...")
+                self._regenerate_techniques_index()
             
             # Step 4: Update/create benchmarking tools
-            self.log("⚡ Updating benchmarking tools...")
-            self._update_benchmarking_examples()
+            if self._wants('benchmark') or self._wants('showcase'):
+                self.log("⚡ Updating benchmarking tools...")
+                self._update_benchmarking_examples()
+            
+            self._save_state()
             
             # Step 5: Build documentation website
-            self.log("🌐 Building documentation website...")
-            self._build_documentation_site()
+            if self._wants('site'):
+                self.log("🌐 Building documentation website...")
+                self._build_documentation_site()
             
             # Step 6: Validate changes
-            self.log("✅ Validating changes...")
-            validation_success = self._validate_changes()
+            validation_success = True
+            if self._wants('validate'):
+                self.log("✅ Validating changes...")
+                validation_success = self._validate_changes()
             
             # Summary
             self._print_update_summary()
@@ -109,9 +526,105 @@ class DocumentationUpdater:
                 traceback.print_exc()
             return False
     
+    def _wants(self, step: str) -> bool:
+        """Whether ``step`` runs, given --only."""
+        return self.config.only is None or step in self.config.only
+    
+    @cached_property
+    def _registry_snapshot(self) -> Dict[str, Any]:
+        """Registered techniques, loaded once and shared by every step."""
+        return dict(_load_registry().list())
+    
+    def _resolve_paths(self) -> Dict[str, Tuple[Path, bool]]:
+        """Resolve the input files of a run to ``(path, exists)`` once."""
+        paths = {
+            'techniques_md': self.config.docs_dir / "techniques.md",
+            'getting_started_md': self.config.docs_dir / "getting_started.md",
+            'readme_md': self.config.project_root / "README.md",
+            'index_script': self.config.tools_dir / "generate_techniques_index.py",
+            'mkdocs_config': self.config.project_root / "mkdocs.yml",
+        }
+        return {key: (path, path.is_file()) for key, path in paths.items()}
+    
+    def _technique_signature(self) -> str:
+        """Digest the technique fields that the markdown updates render.
+        
+        The updater's own mtime is included so edits to its section
+        templates invalidate the markdown updates too.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(str(os.stat(__file__).st_mtime_ns).encode('utf-8'))
+        for name, info in sorted(self.techniques_data['by_name'].items()):
+            h.update(repr((name, info['class_name'], info['category'],
+                           info['description'], tuple(info['dependencies']),
+                           self._get_technique_parameters(info['class_obj']))
+                          ).encode('utf-8'))
+        return h.hexdigest()
+    
+    def _load_state(self) -> Dict[str, Any]:
+        """Load the state file of the last run, or an empty state."""
+        state_file = self.config.project_root / _STATE_FILENAME
+        try:
+            return json.loads(_read(state_file))
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_state(self):
+        """Record the signature, markdown mtimes and artifact input digests."""
+        if self.config.dry_run:
+            return
+        
+        if self._wants('docs'):
+            signature = self._signature
+            files = {}
+            for key in _TRACKED_DOCS:
+                path, exists = self._paths[key]
+                if exists:
+                    files[key] = path.stat().st_mtime_ns
+        else:
+            # The markdown files were not checked this run
+            signature = self._state.get('signature')
+            files = self._state.get('files', {})
+        
+        state_file = self.config.project_root / _STATE_FILENAME
+        state = {'signature': signature, 'files': files, 'artifacts': self._artifacts}
+        _write(state_file, json.dumps(state, indent=2) + '\n')
+    
+    def _is_up_to_date(self, key: str) -> bool:
+        """Whether a tracked file is unchanged since the last run."""
+        if self.config.force_rebuild or self._state.get('signature') != self._signature:
+            return False
+        
+        path, _ = self._paths[key]
+        if self._state.get('files', {}).get(key) != path.stat().st_mtime_ns:
+            return False
+        
+        self.log(f"   ℹ️  {path.name} up to date, skipping")
+        return True
+    
+    def _inputs_digest(self, *inputs) -> str:
+        """Digest the inputs of a generated artifact.
+        
+        The updater's own mtime is included so template edits invalidate
+        every artifact.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((os.stat(__file__).st_mtime_ns,) + inputs).encode('utf-8'))
+        return h.hexdigest()
+    
+    def _artifact_is_current(self, key: str, inputs: str, path: Path) -> bool:
+        """Whether ``path`` was last generated from the same inputs."""
+        if self.config.force_rebuild or not path.is_file():
+            return False
+        if self._state.get('artifacts', {}).get(key) != inputs:
+            return False
+        
+        self.log(f"   ℹ️  {path.name} inputs unchanged, skipping")
+        return True
+    
     def _discover_techniques(self) -> Dict[str, Any]:
         """Discover all registered techniques and organize by category."""
-        techniques = TechniqueRegistry.list()
+        techniques = self._registry_snapshot
         
         if not techniques:
             raise RuntimeError("No techniques found in registry")
@@ -121,18 +634,11 @@ class DocumentationUpdater:
         technique_details = {}
         
         for name, technique_class in techniques.items():
-            meta = technique_class.meta
-            if isinstance(meta, TechniqueMeta):
-                category = meta.category
-                description = meta.description
-                version = getattr(meta, 'version', '1.0.0')  # Default version
-                dependencies = getattr(meta, 'dependencies', [])
-            else:
-                # Handle legacy metadata
-                category = getattr(meta, 'category', 'unknown')
-                description = getattr(meta, 'description', 'No description available')
-                version = getattr(meta, 'version', '1.0.0')
-                dependencies = getattr(meta, 'dependencies', [])
+            key = id(technique_class)
+            resolved = _META_CACHE.get(key)
+            if resolved is None:
+                resolved = _META_CACHE[key] = _resolve_meta(technique_class.meta)
+            category, description, version, dependencies = resolved
             
             if category not in categories:
                 categories[category] = []
@@ -151,6 +657,16 @@ class DocumentationUpdater:
             categories[category].append(technique_info)
             technique_details[name] = technique_info
         
+        # Sort each category once for all generators
+        self._sorted_by_category = {
+            cat: sorted(techs, key=itemgetter('name'))
+            for cat, techs in categories.items()
+        }
+        self._chunking_class_names = tuple(
+            tech['class_name']
+            for tech in self._sorted_by_category.get('chunking', ())
+        )
+        
         return {
             'by_category': categories,
             'by_name': technique_details,
@@ -174,33 +690,31 @@ class DocumentationUpdater:
     
     def _update_techniques_md(self):
         """Update docs/techniques.md with current technique information."""
-        techniques_file = self.config.docs_dir / "techniques.md"
+        techniques_file, techniques_file_exists = self._paths['techniques_md']
         
-        if not techniques_file.exists():
+        if not techniques_file_exists:
             self.log(f"   ⚠️  {techniques_file} not found, skipping...")
             return
         
-        content = techniques_file.read_text(encoding='utf-8')
+        if self._is_up_to_date('techniques_md'):
+            return
+        
+        content = _read(techniques_file)
         
         # Update the chunking techniques section
-        chunking_techniques = self.techniques_data['by_category'].get('chunking', [])
+        chunking_techniques = self._sorted_by_category.get('chunking', ())
         if chunking_techniques:
             chunking_section = self._generate_chunking_section(chunking_techniques)
             
             # Find and replace the chunking techniques section
-            pattern = r'(### Chunking Techniques\s*\n)(.*?)(\n### [^#]|\n## [^#]|\n*$)'
-            
-            if re.search(pattern, content, re.DOTALL):
-                new_content = re.sub(
-                    pattern,
-                    r'\1' + chunking_section + r'\3',
-                    content,
-                    flags=re.DOTALL
-                )
+            span = _find_chunking_section(content)
+            if span is not None:
+                body_start, end = span
+                new_content = content[:body_start] + chunking_section + content[end:]
                 
                 if new_content != content:
                     if not self.config.dry_run:
-                        techniques_file.write_text(new_content, encoding='utf-8')
+                        _write(techniques_file, new_content)
                     self.changes_made.append(f"Updated chunking techniques in {techniques_file.name}")
                     self.log(f"   ✅ Updated chunking techniques section")
                 else:
@@ -212,7 +726,7 @@ class DocumentationUpdater:
         """Generate the chunking techniques section content."""
         lines = []
         
-        for tech in sorted(chunking_techniques, key=lambda x: x['name']):
+        for tech in chunking_techniques:
             # Get parameter information by inspecting the class
             params = self._get_technique_parameters(tech['class_obj'])
             
@@ -234,27 +748,22 @@ class DocumentationUpdater:
     def _get_technique_parameters(self, technique_class) -> List[str]:
         """Extract parameter names from technique constructor."""
         try:
-            import inspect
-            sig = inspect.signature(technique_class.__init__)
-            params = []
-            
-            for name, param in sig.parameters.items():
-                if name != 'self':
-                    params.append(name)
-            
-            return params
+            return list(_constructor_parameters(technique_class))
         except Exception:
             return []
     
     def _update_getting_started_md(self):
         """Update docs/getting_started.md with examples of new techniques."""
-        getting_started_file = self.config.docs_dir / "getting_started.md"
+        getting_started_file, getting_started_file_exists = self._paths['getting_started_md']
         
-        if not getting_started_file.exists():
+        if not getting_started_file_exists:
             self.log(f"   ⚠️  {getting_started_file} not found, skipping...")
             return
         
-        content = getting_started_file.read_text(encoding='utf-8')
+        if self._is_up_to_date('getting_started_md'):
+            return
+        
+        content = _read(getting_started_file)
         
         # Check if advanced chunking section exists
         if "### 2. Advanced Chunking Techniques" in content:
@@ -264,22 +773,24 @@ class DocumentationUpdater:
             chunking_section = self._generate_advanced_chunking_section()
             
             # Find insertion point after basic example
-            basic_pattern = r'(```\n\n)(### 2\. Using the CLI)'
-            if re.search(basic_pattern, content):
-                new_content = re.sub(
-                    basic_pattern,
-                    r'\1' + chunking_section + '\n\n' + r'\2',
-                    content
+            fence = "```\n\n"
+            heading = "### 2. Using the CLI"
+            idx = content.find(fence + heading)
+            if idx >= 0:
+                insert_at = idx + len(fence)
+                new_content = (
+                    content[:insert_at] + chunking_section + '\n\n'
+                    + content[insert_at:]
                 )
                 
                 if not self.config.dry_run:
-                    getting_started_file.write_text(new_content, encoding='utf-8')
+                    _write(getting_started_file, new_content)
                 self.changes_made.append(f"Added advanced chunking section to {getting_started_file.name}")
                 self.log(f"   ✅ Added advanced chunking techniques section")
     
     def _generate_advanced_chunking_section(self) -> str:
         """Generate the advanced chunking techniques section."""
-        chunking_techniques = self.techniques_data['by_category'].get('chunking', [])
+        chunking_techniques = self._sorted_by_category.get('chunking', ())
         
         # Filter to get the new/advanced techniques
         advanced_techniques = [
@@ -396,469 +907,279 @@ for name, technique_class in chunking_techniques.items():
             
     except Exception as e:
         print(f"{name}: Error - {e}")
-```'''
-        
-        return section
-    
-    def _update_readme_md(self):
-        """Update README.md with current technique listings."""
-        readme_file = self.config.project_root / "README.md"
-        
-        if not readme_file.exists():
-            self.log(f"   ⚠️  {readme_file} not found, skipping...")
-            return
-        
-        content = readme_file.read_text(encoding='utf-8')
-        
-        # Update document processing section
-        chunking_techniques = self.techniques_data['by_category'].get('chunking', [])
-        if chunking_techniques:
-            new_section = self._generate_readme_chunking_section(chunking_techniques)
-            
-            # Find and replace the document processing section
-            pattern = r'(### 🔨 Document Processing\s*\n)(- \*\*.*?\n)*'
-            
-            if re.search(pattern, content):
-                new_content = re.sub(
-                    pattern,
-                    r'\1' + new_section,
-                    content
-                )
-                
-                if new_content != content:
-                    if not self.config.dry_run:
-                        readme_file.write_text(new_content, encoding='utf-8')
-                    self.changes_made.append(f"Updated document processing section in {readme_file.name}")
-                    self.log(f"   ✅ Updated README document processing section")
-                else:
-                    self.log(f"   ℹ️  README already up to date")
-    
-    def _generate_readme_chunking_section(self, chunking_techniques: List[Dict]) -> str:
-        """Generate the README chunking section."""
-        lines = []
-        
-        for tech in sorted(chunking_techniques, key=lambda x: x['name']):
-            class_name = tech['class_name']
-            description = tech['description']
-            
-            # Format for README
-            if 'fixed' in tech['name'].lower():
-                lines.append(f"- **Fixed Size Chunking**: {description}")
-            elif 'semantic' in tech['name'].lower():
-                lines.append(f"- **Semantic Chunking**: {description}")
-            elif 'sentence' in tech['name'].lower():
-                lines.append(f"- **Sentence Window Chunking**: {description}")
-            elif 'content' in tech['name'].lower():
-                lines.append(f"- **Content-Aware Chunking**: {description}")
-            elif 'document' in tech['name'].lower():
-                lines.append(f"- **Document-Specific Chunking**: {description}")
-            elif 'recursive' in tech['name'].lower():
-                lines.append(f"- **Recursive Chunking**: {description}")
-            elif 'propositional' in tech['name'].lower():
-                lines.append(f"- **Propositional Chunking**: {description}")
-            elif 'parent' in tech['name'].lower():
-                lines.append(f"- **Parent-Document Chunking**: {description}")
-            else:
-                # Generic format
-                formatted_name = class_name.replace('Chunker', ' Chunking')
-                lines.append(f"- **{formatted_name}**: {description}")
-        
-        return '\n'.join(lines) + '\n'
-    
-    def _regenerate_techniques_index(self):
-        """Regenerate the auto-generated techniques index."""
-        tools_script = self.config.tools_dir / "generate_techniques_index.py"
-        
-        if not tools_script.exists():
-            self.log(f"   ⚠️  {tools_script} not found, skipping...")
-            return
-        
-        try:
-            if not self.config.dry_run:
-                result = subprocess.run([
-                    sys.executable, str(tools_script)
-                ], capture_output=True, text=True, cwd=self.config.project_root)
-                
-                if result.returncode == 0:
-                    self.changes_made.append("Regenerated techniques index")
-                    self.log(f"   ✅ Regenerated techniques index")
-                    if self.config.verbose:
-                        self.log(f"      Output: {result.stdout.strip()}")
-                else:
-                    self.log(f"   ❌ Failed to regenerate techniques index: {result.stderr}")
-            else:
-                self.log(f"   🔍 Would regenerate techniques index")
-                
-        except Exception as e:
-            self.log(f"   ❌ Error regenerating techniques index: {e}")
-    
-    def _update_benchmarking_examples(self):
-        """Update or create benchmarking example files."""
-        # Update chunking benchmark
-        self._create_chunking_benchmark()
-        
-        # Update chunking showcase
-        self._create_chunking_showcase()
-    
-    def _create_chunking_benchmark(self):
-        """Create or update the comprehensive chunking benchmark."""
-        benchmark_file = self.config.examples_dir / "chunking_benchmark_auto.py"
-        
-        chunking_techniques = self.techniques_data['by_category'].get('chunking', [])
-        if not chunking_techniques:
-            self.log(f"   ⚠️  No chunking techniques found, skipping benchmark creation")
-            return
-        
-        benchmark_content = self._generate_benchmark_script(chunking_techniques)
-        
-        if not self.config.dry_run:
-            benchmark_file.write_text(benchmark_content, encoding='utf-8')
-        
-        self.changes_made.append(f"Created/updated {benchmark_file.name}")
-        self.log(f"   ✅ Created chunking benchmark script")
-    
-    def _generate_benchmark_script(self, chunking_techniques: List[Dict]) -> str:
-        """Generate the benchmark script content."""
-        # Get technique names for imports
-        technique_classes = [tech['class_name'] for tech in chunking_techniques]
-        
-        script = f'''#!/usr/bin/env python3
-"""
-Auto-generated Chunking Benchmark Script
-
-This script was automatically generated by the RAGLib documentation updater.
-It benchmarks all {len(chunking_techniques)} available chunking techniques.
-
-Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}
-"""
-
-import json
-import sys
-import time
-from pathlib import Path
-
-# Add raglib to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-try:
-    from raglib.techniques import (
-        {', '.join(technique_classes)}
-    )
-    from raglib.schemas import Document
-    from raglib.registry import TechniqueRegistry
-except ImportError as e:
-    print(f"Failed to import raglib: {{e}}")
-    sys.exit(1)
-
-
-def main():
-    """Run comprehensive benchmark on all chunking techniques."""
-    print("🔬 Auto-Generated Chunking Benchmark")
-    print("=" * 50)
-    
-    # Get all chunking techniques
-    techniques = TechniqueRegistry.find_by_category("chunking")
-    print(f"📊 Testing {{len(techniques)}} chunking techniques")
-    
-    # Test document
-    test_doc = Document(
-        id="test_document",
-        text="""
-# Introduction
-
-This is a test document with various structures. It contains multiple paragraphs,
-different section headings, and various text patterns to test chunking strategies.
-
-## Section 1
-
-Here we have some content that spans multiple sentences. The goal is to see
-how different chunking techniques handle document structure and boundaries.
-
-### Subsection 1.1
-
-More detailed content with technical information. This section contains
-specific details that should ideally stay together for context preservation.
-
-## Section 2
-
-Different content with various formatting. Lists, code blocks, and other
-structural elements challenge chunking algorithms differently.
-
-- Item 1: First list item
-- Item 2: Second list item  
-- Item 3: Third list item
-
-### Code Example
-
-```python
-def example_function():
-    return "Hello, World!"
-```
-
-## Conclusion
-
-This document provides a comprehensive test case for evaluating chunking
-strategies across different text structures and patterns.
-        """,
-        meta={{"type": "test", "structure": "hierarchical"}}
-    )
-    
-    results = {{}}
+```'''
+        
+        return section
     
-    for name, technique_class in techniques.items():
-        print(f"\\n🔍 Testing: {{name}}")
+    def _update_readme_md(self):
+        """Update README.md with current technique listings."""
+        readme_file, readme_file_exists = self._paths['readme_md']
         
-        try:
-            # Initialize with default parameters
-            technique = technique_class()
-            
-            start_time = time.time()
-            result = technique.apply(test_doc)
-            end_time = time.time()
+        if not readme_file_exists:
+            self.log(f"   ⚠️  {readme_file} not found, skipping...")
+            return
+        
+        if self._is_up_to_date('readme_md'):
+            return
+        
+        content = _read(readme_file)
+        
+        # Update document processing section
+        chunking_techniques = self._sorted_by_category.get('chunking', ())
+        if chunking_techniques:
+            new_section = self._generate_readme_chunking_section(chunking_techniques)
             
-            if result.success:
-                # Handle different result formats
-                if name == "parent_document_chunker":
-                    payload = result.payload
-                    child_chunks = payload.get("child_chunks", [])
-                    parent_chunks = payload.get("parent_chunks", [])
-                    
-                    results[name] = {{
-                        "success": True,
-                        "child_chunks": len(child_chunks),
-                        "parent_chunks": len(parent_chunks),
-                        "processing_time": end_time - start_time,
-                        "technique_class": technique_class.__name__
-                    }}
-                    
-                    print(f"   ✅ {{len(child_chunks)}} child chunks, {{len(parent_chunks)}} parent chunks")
-                else:
-                    chunks = result.payload.get("chunks", [])
-                    avg_length = sum(len(c.text) for c in chunks) / len(chunks) if chunks else 0
-                    
-                    results[name] = {{
-                        "success": True,
-                        "num_chunks": len(chunks),
-                        "avg_chunk_length": avg_length,
-                        "processing_time": end_time - start_time,
-                        "technique_class": technique_class.__name__
-                    }}
-                    
-                    print(f"   ✅ {{len(chunks)}} chunks, avg length: {{avg_length:.0f}} chars")
-            else:
-                results[name] = {{
-                    "success": False,
-                    "error": result.error,
-                    "processing_time": end_time - start_time
-                }}
-                print(f"   ❌ Failed: {{result.error}}")
+            # Find and replace the document processing section
+            if _README_DOCPROC_RE.search(content):
+                new_content = _README_DOCPROC_RE.sub(
+                    r'\1' + new_section,
+                    content
+                )
                 
+                if new_content != content:
+                    if not self.config.dry_run:
+                        _write(readme_file, new_content)
+                    self.changes_made.append(f"Updated document processing section in {readme_file.name}")
+                    self.log(f"   ✅ Updated README document processing section")
+                else:
+                    self.log(f"   ℹ️  README already up to date")
+    
+    def _generate_readme_chunking_section(self, chunking_techniques: List[Dict]) -> str:
+        """Generate the README chunking section."""
+        lines = []
+        
+        for tech in chunking_techniques:
+            name_lower = tech['name'].lower()
+            # First matching keyword wins; otherwise derive from the class name
+            label = next(
+                (v for k, v in _README_LABELS.items() if k in name_lower),
+                tech['class_name'].replace('Chunker', ' Chunking'),
+            )
+            lines.append(f"- **{label}**: {tech['description']}")
+        
+        return '\n'.join(lines) + '\n'
+    
+    def _regenerate_techniques_index(self):
+        """Regenerate the auto-generated techniques index.
+        
+        The tool's ``main()`` runs in this process, reusing the loaded
+        registry.
+        """
+        tools_script, tools_script_exists = self._paths['index_script']
+        
+        if not tools_script_exists:
+            self.log(f"   ⚠️  {tools_script} not found, skipping...")
+            return
+        
+        if self.config.dry_run:
+            self.log(f"   🔍 Would regenerate techniques index")
+            return
+        
+        self._index_inputs = self._inputs_digest(
+            os.stat(tools_script).st_mtime_ns,
+            tuple(
+                (name, info['class_name'], info['module'], info['category'],
+                 info['description'], info['version'], info['dependencies'],
+                 info['class_obj'].__doc__)
+                for name, info in sorted(self.techniques_data['by_name'].items())
+            ),
+        )
+        index_file = self.config.docs_dir / "techniques_generated.md"
+        if self._artifact_is_current('techniques_index', self._index_inputs, index_file):
+            return
+        
+        if self.config.force_rebuild:
+            # Make the tool render the index instead of trusting its digest
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.config.docs_dir / ".techniques_index.hash")
+        
+        self._index_mtime_before = self._index_mtime()
+        try:
+            self._report_techniques_index(self._run_techniques_index(tools_script))
         except Exception as e:
-            results[name] = {{
-                "success": False,
-                "error": str(e),
-                "processing_time": 0
-            }}
-            print(f"   💥 Exception: {{e}}")
+            self.log(f"   ❌ Error regenerating techniques index: {e}")
     
-    # Save results
-    output_file = Path(__file__).parent / "chunking_benchmark_results_auto.json"
-    with open(output_file, 'w') as f:
-        json.dump({{
-            "timestamp": time.strftime('%Y-%m-%d %H:%M:%S'),
-            "total_techniques": len(techniques),
-            "results": results
-        }}, f, indent=2)
+    def _run_techniques_index(self, tools_script: Path) -> bool:
+        """Call the index tool's ``main()``; its output is shown only with --verbose."""
+        tools_dir = str(tools_script.parent)
+        if tools_dir not in sys.path:
+            sys.path.insert(0, tools_dir)
+        try:
+            tool = importlib.import_module(tools_script.stem)
+        except SystemExit:
+            # the tool exits when raglib cannot be imported
+            return False
+        
+        try:
+            if self.config.verbose:
+                returncode = tool.main()
+            else:
+                with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+                    returncode = tool.main()
+        except SystemExit as e:
+            returncode = e.code
+        return returncode in (None, 0)
     
-    print(f"\\n💾 Results saved to: {{output_file}}")
+    def _report_techniques_index(self, success: bool):
+        """Log the outcome of an index run; only a rewrite counts as a change."""
+        if not success:
+            self.log(f"   ❌ Failed to regenerate techniques index")
+            return
+        
+        self._artifacts['techniques_index'] = self._index_inputs
+        if self._index_mtime() != self._index_mtime_before:
+            self.changes_made.append("Regenerated techniques index")
+            self.log(f"   ✅ Regenerated techniques index")
+        else:
+            self.log(f"   ℹ️  Techniques index already up to date")
     
-    # Summary
-    successful = sum(1 for r in results.values() if r.get("success", False))
-    print(f"\\n📊 Summary: {{successful}}/{{len(results)}} techniques successful")
-
-
-if __name__ == "__main__":
-    main()
-'''
+    def _index_mtime(self) -> Optional[int]:
+        """mtime of docs/techniques_generated.md, or None if missing."""
+        try:
+            return os.stat(self.config.docs_dir / "techniques_generated.md").st_mtime_ns
+        except OSError:
+            return None
+    
+    def _update_benchmarking_examples(self):
+        """Update or create benchmarking example files."""
+        # Update chunking benchmark
+        if self._wants('benchmark'):
+            self._create_chunking_benchmark()
+        
+        # Update chunking showcase
+        if self._wants('showcase'):
+            self._create_chunking_showcase()
+    
+    def _create_chunking_benchmark(self):
+        """Create or update the comprehensive chunking benchmark."""
+        benchmark_file = self.config.examples_dir / "chunking_benchmark_auto.py"
+        
+        chunking_techniques = self._sorted_by_category.get('chunking', ())
+        if not chunking_techniques:
+            self.log(f"   ⚠️  No chunking techniques found, skipping benchmark creation")
+            return
+        
+        inputs = self._inputs_digest(
+            tuple((tech['name'], tech['class_name']) for tech in chunking_techniques)
+        )
+        if self._artifact_is_current('chunking_benchmark', inputs, benchmark_file):
+            return
+        
+        benchmark_content = self._generate_benchmark_script(chunking_techniques)
+        
+        if self.config.dry_run:
+            self.log(f"   🔍 Would create/update {benchmark_file.name}")
+            return
         
-        return script
+        written = _write_if_changed(benchmark_file, benchmark_content)
+        self._artifacts['chunking_benchmark'] = inputs
+        if written:
+            self.changes_made.append(f"Created/updated {benchmark_file.name}")
+            self.log(f"   ✅ Created chunking benchmark script")
+        else:
+            self.log(f"   ℹ️  {benchmark_file.name} already up to date")
+    
+    def _generate_benchmark_script(self, chunking_techniques: List[Dict]) -> str:
+        """Generate the benchmark script content."""
+        header = _SCRIPT_HEADER.format(
+            docstring=_BENCHMARK_DOCSTRING.format(count=len(chunking_techniques)),
+            generated_on=time.strftime('%Y-%m-%d %H:%M:%S'),
+            stdlib_imports="import json\nimport sys\nimport time\nfrom pathlib import Path\n",
+            imports=', '.join(self._chunking_class_names),
+            extra_imports="    from raglib.registry import TechniqueRegistry\n",
+        )
+        return header + _BENCHMARK_SCRIPT_BODY
     
     def _create_chunking_showcase(self):
         """Create or update the chunking showcase script."""
         showcase_file = self.config.examples_dir / "chunking_showcase_auto.py"
         
-        chunking_techniques = self.techniques_data['by_category'].get('chunking', [])
+        chunking_techniques = self._sorted_by_category.get('chunking', ())
         if not chunking_techniques:
             return
         
+        inputs = self._inputs_digest(
+            tuple((tech['name'], tech['class_name']) for tech in chunking_techniques)
+        )
+        if self._artifact_is_current('chunking_showcase', inputs, showcase_file):
+            return
+        
         showcase_content = self._generate_showcase_script(chunking_techniques)
         
-        if not self.config.dry_run:
-            showcase_file.write_text(showcase_content, encoding='utf-8')
+        if self.config.dry_run:
+            self.log(f"   🔍 Would create/update {showcase_file.name}")
+            return
         
-        self.changes_made.append(f"Created/updated {showcase_file.name}")
-        self.log(f"   ✅ Created chunking showcase script")
+        written = _write_if_changed(showcase_file, showcase_content)
+        self._artifacts['chunking_showcase'] = inputs
+        if written:
+            self.changes_made.append(f"Created/updated {showcase_file.name}")
+            self.log(f"   ✅ Created chunking showcase script")
+        else:
+            self.log(f"   ℹ️  {showcase_file.name} already up to date")
     
     def _generate_showcase_script(self, chunking_techniques: List[Dict]) -> str:
         """Generate the showcase script content."""
-        technique_classes = [tech['class_name'] for tech in chunking_techniques]
-        
-        script = f'''#!/usr/bin/env python3
-"""
-Auto-generated Chunking Showcase Script
-
-This script demonstrates all available chunking techniques with examples.
-Generated automatically by the RAGLib documentation updater.
-
-Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}
-"""
-
-import sys
-from pathlib import Path
-
-# Add raglib to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-try:
-    from raglib.techniques import (
-        {', '.join(technique_classes)}
-    )
-    from raglib.schemas import Document
-except ImportError as e:
-    print(f"Failed to import raglib: {{e}}")
-    sys.exit(1)
-
-
-def main():
-    """Demonstrate all chunking techniques."""
-    print("🔬 RAGLib Chunking Techniques Showcase")
-    print("=" * 50)
-    
-    # Test document
-    document = Document(
-        id="showcase_doc",
-        text="""
-# Machine Learning Fundamentals
-
-## Introduction
-
-Machine learning is a subset of artificial intelligence that focuses on 
-algorithms that can learn and improve from experience.
-
-### Supervised Learning
-
-In supervised learning, algorithms learn from labeled training data.
-Common examples include:
-
-- Classification problems
-- Regression analysis
-- Pattern recognition
-
-### Unsupervised Learning
-
-Unsupervised learning finds hidden patterns in data without labels.
-This includes clustering and dimensionality reduction techniques.
-
-## Applications
-
-Machine learning has numerous real-world applications:
-
-1. Computer vision and image recognition
-2. Natural language processing
-3. Recommendation systems
-4. Autonomous vehicles
-
-## Conclusion
-
-Understanding these fundamentals provides a solid foundation for
-exploring more advanced machine learning concepts.
-        """,
-        meta={{"type": "educational", "topic": "machine_learning"}}
-    )
-    
-    # Initialize all techniques
-    techniques = [
-'''
+        parts = [_SCRIPT_HEADER.format(
+            docstring=_SHOWCASE_DOCSTRING,
+            generated_on=time.strftime('%Y-%m-%d %H:%M:%S'),
+            stdlib_imports="import sys\nfrom pathlib import Path\n",
+            imports=', '.join(self._chunking_class_names),
+            extra_imports="",
+        ), _SHOWCASE_SCRIPT_BODY]
         
         # Add technique initializations
         for tech in chunking_techniques:
             class_name = tech['class_name']
             if 'parent' in tech['name'].lower():
-                script += f'        ("{class_name}", {class_name}(child_chunk_size=100, parent_chunk_size=300)),\n'
+                args = "child_chunk_size=100, parent_chunk_size=300"
             elif 'content' in tech['name'].lower():
-                script += f'        ("{class_name}", {class_name}(max_chunk_size=200)),\n'
+                args = "max_chunk_size=200"
             elif 'semantic' in tech['name'].lower():
-                script += f'        ("{class_name}", {class_name}(chunk_size=200)),\n'
+                args = "chunk_size=200"
             elif 'sentence' in tech['name'].lower():
-                script += f'        ("{class_name}", {class_name}(window_size=3)),\n'
-            else:
-                script += f'        ("{class_name}", {class_name}(chunk_size=200)),\n'
-        
-        script += '''    ]
-    
-    print(f"Testing {len(techniques)} chunking techniques:")
-    print()
-    
-    for name, technique in techniques:
-        try:
-            result = technique.apply(document)
-            
-            if result.success:
-                if "Parent" in name:
-                    payload = result.payload
-                    child_count = len(payload.get("child_chunks", []))
-                    parent_count = len(payload.get("parent_chunks", []))
-                    print(f"✅ {name}: {child_count} child, {parent_count} parent chunks")
-                else:
-                    chunks = result.payload.get("chunks", [])
-                    if chunks:
-                        avg_length = sum(len(c.text) for c in chunks) / len(chunks)
-                        print(f"✅ {name}: {len(chunks)} chunks (avg: {avg_length:.0f} chars)")
-                        
-                        # Show first chunk preview
-                        if self.config.verbose and chunks:
-                            preview = chunks[0].text[:100].replace('\\n', ' ').strip()
-                            print(f"   Preview: {preview}...")
-                    else:
-                        print(f"✅ {name}: No chunks created")
+                args = "window_size=3"
             else:
-                print(f"❌ {name}: {result.error}")
-                
-        except Exception as e:
-            print(f"💥 {name}: {e}")
-    
-    print("\\n🎉 Showcase complete!")
-
-
-if __name__ == "__main__":
-    main()
-'''
+                args = "chunk_size=200"
+            parts.append(f'        ("{class_name}", {class_name}({args})),\n')
         
-        return script
+        parts.append(_SHOWCASE_SCRIPT_FOOTER)
+        return "".join(parts)
     
     def _build_documentation_site(self):
         """Build the documentation website using mkdocs."""
-        mkdocs_config = self.config.project_root / "mkdocs.yml"
+        mkdocs_config, mkdocs_config_exists = self._paths['mkdocs_config']
         
-        if not mkdocs_config.exists():
+        if not mkdocs_config_exists:
             self.log(f"   ⚠️  mkdocs.yml not found, skipping site build")
             return
         
+        site_dir = self.config.project_root / "site"
+        if not self.config.force_rebuild and site_is_current(self.config.project_root, site_dir):
+            self.log(f"   ✅ Site up to date, skipping build")
+            return
+        
         try:
             if not self.config.dry_run:
-                result = subprocess.run([
-                    "mkdocs", "build"
-                ], capture_output=True, text=True, cwd=self.config.project_root)
+                cmd = ["mkdocs", "build"]
+                if not (self.config.force_rebuild
+                        or site_needs_full_build(self.config.project_root, site_dir)):
+                    cmd.append("--dirty")
+                # --verbose lets mkdocs write to the terminal directly;
+                # stderr is only decoded if the build fails
+                result = subprocess.run(
+                    cmd, cwd=self.config.project_root,
+                    stdout=None if self.config.verbose else subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
                 
                 if result.returncode == 0:
+                    write_build_stamp(self.config.project_root, site_dir)
                     self.changes_made.append("Built documentation website")
                     self.log(f"   ✅ Documentation website built successfully")
-                    if self.config.verbose and result.stdout:
-                        self.log(f"      {result.stdout.strip()}")
                 else:
-                    self.log(f"   ❌ Failed to build documentation: {result.stderr}")
+                    stderr = result.stderr.decode('utf-8', errors='replace')
+                    self.log(f"   ❌ Failed to build documentation: {stderr}")
             else:
                 self.log(f"   🔍 Would build documentation website")
                 
@@ -875,19 +1196,13 @@ if __name__ == "__main__":
         
         validation_errors = []
         
-        # Check that techniques index was generated
-        techniques_generated = self.config.docs_dir / "techniques_generated.md"
-        if not techniques_generated.exists():
-            validation_errors.append("techniques_generated.md not found")
-        
         # Check that documentation builds without errors
-        site_dir = self.config.project_root / "site"
-        if not site_dir.exists():
+        if not os.path.isdir(self.config.project_root / "site"):
             validation_errors.append("Documentation site not built")
         
         # Run a quick test to ensure techniques are discoverable
         try:
-            techniques = TechniqueRegistry.list()
+            techniques = self._registry_snapshot
             if not techniques:
                 validation_errors.append("No techniques found in registry")
         except Exception as e:
@@ -920,7 +1235,7 @@ if __name__ == "__main__":
         print(f"\\n📊 Current state:")
         print(f"   - {self.techniques_data['total_count']} total techniques")
         print(f"   - {self.techniques_data['category_count']} categories")
-        print(f"   - {len(self.techniques_data['by_category'].get('chunking', []))} chunking techniques")
+        print(f"   - {len(self._sorted_by_category.get('chunking', ()))} chunking techniques")
     
     def log(self, message: str):
         """Log a message with optional verbose output."""
@@ -948,6 +1263,14 @@ def main():
         action="store_true", 
         help="Force rebuild of all documentation even if up to date"
     )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=UPDATE_STEPS,
+        metavar="STEP",
+        help=f"Run only these steps ({', '.join(UPDATE_STEPS)}); "
+             "technique discovery always runs"
+    )
     
     args = parser.parse_args()
     
@@ -960,7 +1283,8 @@ def main():
         tools_dir=project_root / "tools",
         dry_run=args.dry_run,
         verbose=args.verbose,
-        force_rebuild=args.force_rebuild
+        force_rebuild=args.force_rebuild,
+        only=tuple(args.only) if args.only else None
     )
     
     # Run the update
@@ -13,16 +13,146 @@ Commands:
     serve           - Build and serve documentation locally
     validate        - Validate all documentation
     clean           - Clean generated files
-    full            - Complete rebuild (clean + update + build)
+    full            - Complete rebuild (update + build; clean with --force-rebuild)
 """
 
 import argparse
+import functools
+import http.server
+import importlib
+import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
-import shutil
 import time
 
+from site_build import site_needs_full_build, write_build_stamp
+
+# Add raglib to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# raglib.techniques is lazy, so this only costs the registry module; a
+# failure is reported by the commands that need the registry
+try:
+    from raglib.registry import TechniqueRegistry
+    _RAGLIB_IMPORT_ERROR = None
+except ImportError as e:
+    TechniqueRegistry = None
+    _RAGLIB_IMPORT_ERROR = e
+
+# watchdog ships with mkdocs; livereload is optional for browser refresh
+try:
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+try:
+    from livereload import Server as LiveReloadServer
+    LIVERELOAD_AVAILABLE = True
+except ImportError:
+    LIVERELOAD_AVAILABLE = False
+
+# Registered techniques keyed by the mtime of raglib/techniques/__init__.py
+_REGISTRY_CACHE = {}
+
+
+def _registered_techniques(project_root: Path) -> dict:
+    """Return a snapshot of the technique registry, loading it once."""
+    if TechniqueRegistry is None:
+        raise _RAGLIB_IMPORT_ERROR
+    
+    techniques_init = project_root / "raglib" / "techniques" / "__init__.py"
+    key = techniques_init.stat().st_mtime_ns if techniques_init.exists() else None
+    if key not in _REGISTRY_CACHE:
+        _REGISTRY_CACHE[key] = dict(TechniqueRegistry.list())
+    return _REGISTRY_CACHE[key]
+
+
+def _fast_rmtree(root: Path) -> bool:
+    """Remove a directory tree with one scandir per directory.
+    
+    Returns False if ``root`` did not exist. A symlinked ``root`` is
+    unlinked, never followed.
+    """
+    if os.path.islink(root):
+        os.unlink(root)
+        return True
+    
+    stack = [str(root)]
+    dirs = []
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        os.unlink(entry.path)
+        except FileNotFoundError:
+            if not dirs:
+                return False
+            continue
+        dirs.append(path)
+    
+    # Parents are listed before their children
+    for path in reversed(dirs):
+        os.rmdir(path)
+    return True
+
+
+def _count_html(root: Path) -> int:
+    """Count the .html files under ``root`` without building Path objects."""
+    count = 0
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.html'):
+                    count += 1
+    return count
+
+
+class _DebouncedBuild:
+    """Watchdog handler that collapses a burst of edits into one build.
+    
+    Every event (re)schedules the build ``delay`` seconds into the future,
+    so it only runs once the sources have been quiet for that long.
+    """
+    
+    def __init__(self, build, accept, delay: float = 0.5):
+        self._build = build
+        self._accept = accept
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._timer = None
+        self._changed = set()
+    
+    def dispatch(self, event):
+        if event.is_directory or not self._accept(event.src_path):
+            return
+        with self._lock:
+            self._changed.add(event.src_path)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._delay, self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _fire(self):
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            self._timer = None
+        print(f"\n   🔄 {len(changed)} file(s) changed, rebuilding...")
+        self._build()
+
+
 class DocumentationManager:
     """Manages all documentation-related tasks for RAGLib."""
     
@@ -34,7 +164,8 @@ class DocumentationManager:
         self.tools_dir = project_root / "tools"
         self.site_dir = project_root / "site"
     
-    def update_docs(self, dry_run: bool = False, verbose: bool = False) -> bool:
+    def update_docs(self, dry_run: bool = False, verbose: bool = False,
+                    force_rebuild: bool = False) -> bool:
         """Update all documentation using the auto-updater."""
         print("📝 Updating Documentation")
         print("-" * 30)
@@ -49,6 +180,8 @@ class DocumentationManager:
             cmd.append("--dry-run")
         if verbose:
             cmd.append("--verbose")
+        if force_rebuild:
+            cmd.append("--force-rebuild")
         
         try:
             result = subprocess.run(cmd, cwd=self.project_root)
@@ -67,17 +200,24 @@ class DocumentationManager:
             print("❌ Techniques index generator not found!")
             return False
         
+        # Run the generator in this process; it reuses the loaded registry
+        tools_dir = str(self.tools_dir)
+        if tools_dir not in sys.path:
+            sys.path.insert(0, tools_dir)
+        
         try:
-            result = subprocess.run([
-                sys.executable, str(generator_script)
-            ], cwd=self.project_root)
+            generator = importlib.import_module(generator_script.stem)
             
-            if result.returncode == 0:
+            if generator.main() == 0:
                 print("✅ Techniques index generated successfully")
                 return True
             else:
                 print("❌ Failed to generate techniques index")
                 return False
+        except SystemExit:
+            # The generator exits at import time when raglib is unavailable
+            print("❌ Failed to generate techniques index")
+            return False
         except Exception as e:
             print(f"❌ Error generating techniques index: {e}")
             return False
@@ -87,69 +227,79 @@ class DocumentationManager:
         print("⚡ Running Benchmarks")
         print("-" * 20)
         
-        # Run chunking benchmark
-        chunking_benchmark = self.examples_dir / "chunking_benchmark.py"
-        if chunking_benchmark.exists():
-            print("   🔬 Running chunking benchmark...")
-            try:
-                result = subprocess.run([
-                    sys.executable, str(chunking_benchmark)
-                ], cwd=self.project_root, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    print("   ✅ Chunking benchmark completed")
-                else:
-                    print(f"   ⚠️  Chunking benchmark had issues: {result.stderr}")
-            except Exception as e:
-                print(f"   ❌ Chunking benchmark failed: {e}")
+        # Both benchmarks are independent: start them together, then reap
+        benchmarks = [
+            ("chunking benchmark", "🔬", self.examples_dir / "chunking_benchmark.py"),
+            ("auto-generated benchmark", "🤖", self.examples_dir / "chunking_benchmark_auto.py"),
+        ]
         
-        # Run auto-generated benchmark if it exists
-        auto_benchmark = self.examples_dir / "chunking_benchmark_auto.py"
-        if auto_benchmark.exists():
-            print("   🤖 Running auto-generated benchmark...")
+        running = []
+        for label, icon, script in benchmarks:
+            if not script.exists():
+                continue
+            print(f"   {icon} Running {label}...")
             try:
-                result = subprocess.run([
-                    sys.executable, str(auto_benchmark)
-                ], cwd=self.project_root, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    print("   ✅ Auto-generated benchmark completed")
-                else:
-                    print(f"   ⚠️  Auto-generated benchmark had issues")
+                proc = subprocess.Popen([
+                    sys.executable, str(script)
+                ], cwd=self.project_root, stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE, text=True)
             except Exception as e:
-                print(f"   ❌ Auto-generated benchmark failed: {e}")
+                print(f"   ❌ {label.capitalize()} failed: {e}")
+                continue
+            running.append((label, proc))
+        
+        failures = {}
+        for label, proc in running:
+            _, stderr = proc.communicate()
+            if proc.returncode == 0:
+                print(f"   ✅ {label.capitalize()} completed")
+            else:
+                failures[label] = stderr
+        
+        for label, stderr in failures.items():
+            print(f"   ⚠️  {label.capitalize()} had issues: {stderr}")
         
         print("   📊 Benchmark summary available in examples/ directory")
         return True
     
     def build_docs(self, clean: bool = False) -> bool:
-        """Build the documentation website."""
+        """Build the documentation website.
+        
+        Builds incrementally (``mkdocs build --dirty``) unless ``clean`` is
+        set or the site configuration changed since the last build.
+        """
         print("🌐 Building Documentation Website")
         print("-" * 35)
         
-        if clean and self.site_dir.exists():
-            print("   🧹 Cleaning previous build...")
-            shutil.rmtree(self.site_dir)
+        if clean and _fast_rmtree(self.site_dir):
+            print("   🧹 Cleaned previous build")
         
         mkdocs_config = self.project_root / "mkdocs.yml"
         if not mkdocs_config.exists():
             print("❌ mkdocs.yml not found!")
             return False
         
+        cmd = ["mkdocs", "build"]
+        if site_needs_full_build(self.project_root, self.site_dir):
+            print("   🔁 Full build")
+        else:
+            cmd.append("--dirty")
+            print("   ⚡ Incremental build")
+        
         try:
-            result = subprocess.run([
-                "mkdocs", "build"
-            ], cwd=self.project_root, capture_output=True, text=True)
+            result = subprocess.run(
+                cmd, cwd=self.project_root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
             
             if result.returncode == 0:
+                write_build_stamp(self.project_root, self.site_dir)
                 print("✅ Documentation website built successfully")
-                if self.site_dir.exists():
-                    # Count generated files
-                    html_files = list(self.site_dir.rglob("*.html"))
-                    print(f"   📄 Generated {len(html_files)} HTML pages")
+                # Count generated files
+                print(f"   📄 Generated {_count_html(self.site_dir)} HTML pages")
                 return True
             else:
-                print(f"❌ Failed to build documentation: {result.stderr}")
+                stderr = result.stderr.decode('utf-8', errors='replace')
+                print(f"❌ Failed to build documentation: {stderr}")
                 return False
         except FileNotFoundError:
             print("❌ mkdocs not found. Install with: pip install mkdocs-material")
@@ -159,7 +309,12 @@ class DocumentationManager:
             return False
     
     def serve_docs(self, port: int = 8000) -> bool:
-        """Build and serve documentation locally."""
+        """Build and serve documentation locally.
+        
+        With watchdog available, edits under docs/ and to mkdocs.yml are
+        debounced into a single incremental rebuild and site/ is served
+        directly; otherwise this falls back to ``mkdocs serve``.
+        """
         print(f"🚀 Serving Documentation on http://localhost:{port}")
         print("-" * 50)
         
@@ -167,12 +322,53 @@ class DocumentationManager:
         if not self.build_docs():
             return False
         
+        if not WATCHDOG_AVAILABLE:
+            return self._serve_with_mkdocs(port)
+        
+        mkdocs_config = str(self.project_root / "mkdocs.yml")
+        docs_dir = str(self.docs_dir) + os.sep
+        handler = _DebouncedBuild(
+            self.build_docs,
+            lambda path: path == mkdocs_config or path.startswith(docs_dir),
+        )
+        observer = Observer()
+        observer.schedule(handler, str(self.docs_dir), recursive=True)
+        observer.schedule(handler, str(self.project_root), recursive=False)
+        observer.start()
+        
+        try:
+            print(f"   🌐 Starting server on port {port}...")
+            print("   ⚠️  Press Ctrl+C to stop the server")
+            
+            if LIVERELOAD_AVAILABLE:
+                server = LiveReloadServer()
+                server.watch(str(self.site_dir))
+                server.serve(root=str(self.site_dir), host="localhost", port=port)
+            else:
+                request_handler = functools.partial(
+                    http.server.SimpleHTTPRequestHandler, directory=str(self.site_dir)
+                )
+                with http.server.ThreadingHTTPServer(("localhost", port), request_handler) as httpd:
+                    httpd.serve_forever()
+            return True
+        except KeyboardInterrupt:
+            print("\n   ⚠️  Server stopped by user")
+            return True
+        except Exception as e:
+            print(f"❌ Error serving documentation: {e}")
+            return False
+        finally:
+            observer.stop()
+            observer.join()
+    
+    def _serve_with_mkdocs(self, port: int) -> bool:
+        """Serve with ``mkdocs serve`` when watchdog is unavailable."""
         try:
             print(f"   🌐 Starting server on port {port}...")
             print("   ⚠️  Press Ctrl+C to stop the server")
             
             result = subprocess.run([
-                "mkdocs", "serve", "--dev-addr", f"localhost:{port}"
+                "mkdocs", "serve", "--dirtyreload", "--dev-addr", f"localhost:{port}"
             ], cwd=self.project_root)
             
             return result.returncode == 0
@@ -193,29 +389,33 @@ class DocumentationManager:
         
         issues = []
         
-        # Check core files exist
+        # Check core files exist, listing each directory once
         core_files = [
-            self.docs_dir / "index.md",
-            self.docs_dir / "techniques.md",
-            self.docs_dir / "getting_started.md",
-            self.docs_dir / "techniques_generated.md",
-            self.project_root / "README.md",
-            self.project_root / "mkdocs.yml"
+            (self.docs_dir, "index.md"),
+            (self.docs_dir, "techniques.md"),
+            (self.docs_dir, "getting_started.md"),
+            (self.docs_dir, "techniques_generated.md"),
+            (self.project_root, "README.md"),
+            (self.project_root, "mkdocs.yml"),
         ]
+        listings = {}
+        for directory, _ in core_files:
+            if directory not in listings:
+                try:
+                    with os.scandir(directory) as entries:
+                        listings[directory] = {entry.name for entry in entries}
+                except OSError:
+                    listings[directory] = set()
         
-        for file_path in core_files:
-            if not file_path.exists():
-                issues.append(f"Missing file: {file_path.name}")
+        for directory, name in core_files:
+            if name not in listings[directory]:
+                issues.append(f"Missing file: {name}")
             else:
-                print(f"   ✅ {file_path.name}")
+                print(f"   ✅ {name}")
         
         # Check that techniques are registered
         try:
-            sys.path.insert(0, str(self.project_root))
-            from raglib.registry import TechniqueRegistry
-            import raglib.techniques
-            
-            techniques = TechniqueRegistry.list()
+            techniques = _registered_techniques(self.project_root)
             if not techniques:
                 issues.append("No techniques found in registry")
             else:
@@ -224,7 +424,7 @@ class DocumentationManager:
             issues.append(f"Failed to import raglib: {e}")
         
         # Check documentation builds
-        if not self.site_dir.exists():
+        if not os.path.isdir(self.site_dir):
             issues.append("Documentation site not built")
         else:
             print(f"   ✅ Documentation site exists")
@@ -250,8 +450,10 @@ class DocumentationManager:
             self.project_root / "__pycache__",
         ]
         
-        # Files to clean  
+        # Files to clean, including the state that lets updates skip work
         files_to_clean = [
+            self.project_root / ".raglib_docs_state.json",
+            self.docs_dir / ".techniques_index.hash",
             self.docs_dir / "techniques_generated.md",
             self.examples_dir / "chunking_benchmark_auto.py",
             self.examples_dir / "chunking_showcase_auto.py",
@@ -262,16 +464,17 @@ class DocumentationManager:
         cleaned_count = 0
         
         for dir_path in dirs_to_clean:
-            if dir_path.exists():
-                shutil.rmtree(dir_path)
+            if _fast_rmtree(dir_path):
                 print(f"   🗑️  Removed directory: {dir_path.name}")
                 cleaned_count += 1
         
         for file_path in files_to_clean:
-            if file_path.exists():
-                file_path.unlink()
-                print(f"   🗑️  Removed file: {file_path.name}")
-                cleaned_count += 1
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                continue
+            print(f"   🗑️  Removed file: {file_path.name}")
+            cleaned_count += 1
         
         if cleaned_count == 0:
             print("   ℹ️  No files to clean")
@@ -280,19 +483,25 @@ class DocumentationManager:
         
         return True
     
-    def full_rebuild(self, verbose: bool = False) -> bool:
-        """Complete rebuild of all documentation."""
+    def full_rebuild(self, verbose: bool = False, force_rebuild: bool = False) -> bool:
+        """Complete rebuild of all documentation.
+        
+        Generated files and the site are only cleaned with ``force_rebuild``;
+        otherwise the site is built incrementally.
+        """
         print("🔄 Full Documentation Rebuild")
         print("=" * 35)
         start_time = time.time()
         
         steps = [
-            ("Clean", lambda: self.clean_generated()),
-            ("Update", lambda: self.update_docs(verbose=verbose)),
+            ("Update", lambda: self.update_docs(
+                verbose=verbose, force_rebuild=force_rebuild)),
             ("Generate", lambda: self.generate_techniques_index()),
-            ("Build", lambda: self.build_docs(clean=True)),
+            ("Build", lambda: self.build_docs(clean=force_rebuild)),
             ("Validate", lambda: self.validate_docs()),
         ]
+        if force_rebuild:
+            steps.insert(0, ("Clean", lambda: self.clean_generated()))
         
         for step_name, step_func in steps:
             print(f"\n🔸 Step: {step_name}")
@@ -319,6 +528,7 @@ Examples:
     python manage_docs.py build               # Build website
     python manage_docs.py serve               # Serve locally
     python manage_docs.py full --verbose      # Complete rebuild
+    python manage_docs.py full --force-rebuild  # Clean, then rebuild from scratch
         """
     )
     
@@ -340,6 +550,18 @@ Examples:
         help="Show detailed output"
     )
     
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Remove the previous site before building (build only)"
+    )
+    
+    parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="Clean generated files and rebuild the site from scratch (full only)"
+    )
+    
     parser.add_argument(
         "--port",
         type=int,
@@ -366,7 +588,7 @@ Examples:
     elif args.command == "benchmark":
         success = manager.run_benchmarks()
     elif args.command == "build":
-        success = manager.build_docs()
+        success = manager.build_docs(clean=args.clean)
     elif args.command == "serve":
         success = manager.serve_docs(port=args.port)
     elif args.command == "validate":
@@ -374,7 +596,7 @@ Examples:
     elif args.command == "clean":
         success = manager.clean_generated()
     elif args.command == "full":
-        success = manager.full_rebuild(verbose=args.verbose)
+        success = manager.full_rebuild(verbose=args.verbose, force_rebuild=args.force_rebuild)
     
     if success:
         print(f"\n✅ Command '{args.command}' completed successfully!")
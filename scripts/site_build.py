@@ -0,0 +1,92 @@
+"""
+Build stamp helpers shared by the documentation scripts.
+
+The stamp records when the site was last built and from which pages, so
+builds can be skipped when nothing changed or run incrementally with
+``mkdocs build --dirty`` when only page contents changed.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Written to the site directory after every successful mkdocs build
+BUILD_STAMP = ".build-stamp"
+
+
+def _scan_site_sources(project_root: Path) -> Tuple[set, int, int]:
+    """Walk the site sources: mkdocs.yml, docs/ and the raglib package.
+    
+    Returns the set of markdown pages (relative to docs/), the newest page
+    mtime, and the newest mtime of every other source file. Directory
+    mtimes are not used; added or removed pages show up in the page set.
+    """
+    pages = set()
+    newest_page = newest_other = 0
+    try:
+        newest_other = os.stat(project_root / "mkdocs.yml").st_mtime_ns
+    except OSError:
+        pass
+    
+    docs_dir = str(project_root / "docs")
+    for root in (docs_dir, str(project_root / "raglib")):
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            for name in filenames:
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                if root == docs_dir and name.endswith('.md'):
+                    pages.add(os.path.relpath(path, docs_dir).replace(os.sep, '/'))
+                    newest_page = max(newest_page, mtime)
+                else:
+                    newest_other = max(newest_other, mtime)
+    return pages, newest_page, newest_other
+
+
+def _read_build_stamp(site_dir: Path) -> Optional[Tuple[int, set]]:
+    """Return the stamp's mtime and the pages it recorded, if it exists."""
+    stamp = site_dir / BUILD_STAMP
+    try:
+        built = os.stat(stamp).st_mtime_ns
+        pages = set(stamp.read_text(encoding='utf-8').splitlines())
+    except OSError:
+        return None
+    return built, pages
+
+
+def site_needs_full_build(project_root: Path, site_dir: Path) -> bool:
+    """Whether the site must be rebuilt from scratch rather than with --dirty.
+    
+    --dirty only re-renders edited pages, so a full build is needed when
+    there is no build stamp, when pages were added or removed (navigation
+    changes on every page), or when any non-page source changed.
+    """
+    stamp = _read_build_stamp(site_dir)
+    if stamp is None:
+        return True
+    built, stamped_pages = stamp
+    pages, _, newest_other = _scan_site_sources(project_root)
+    return pages != stamped_pages or newest_other > built
+
+
+def site_is_current(project_root: Path, site_dir: Path) -> bool:
+    """Whether the last build is newer than all of its sources."""
+    stamp = _read_build_stamp(site_dir)
+    if stamp is None:
+        return False
+    built, stamped_pages = stamp
+    pages, newest_page, newest_other = _scan_site_sources(project_root)
+    return pages == stamped_pages and max(newest_page, newest_other) <= built
+
+
+def write_build_stamp(project_root: Path, site_dir: Path) -> None:
+    """Record a successful mkdocs build and the pages it was built from."""
+    pages, _, _ = _scan_site_sources(project_root)
+    (site_dir / BUILD_STAMP).write_text(
+        ''.join(f"{page}\n" for page in sorted(pages)), encoding='utf-8'
+    )
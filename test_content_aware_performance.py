@@ -17,11 +17,14 @@ test_text = (
 chunker = ContentAwareChunker(max_chunk_size=100, min_chunk_size=20)
 doc = Document(id='test_doc', text=test_text)
 
-start_time = time.time()
-result = chunker.apply(doc)
-end_time = time.time()
+# Average over repeated calls; only apply() is inside the timed region
+runs = 100
+start_ns = time.perf_counter_ns()
+for _ in range(runs):
+    result = chunker.apply(doc)
+end_ns = time.perf_counter_ns()
 
-print(f'Time taken: {end_time - start_time:.3f} seconds')
+print(f'Time taken: {(end_ns - start_ns) / runs / 1e6:.3f} ms per call ({runs} runs)')
 print(f'Success: {result.success}')
 print(f'Number of chunks: {len(result.payload["chunks"])}')
 
@@ -1,9 +1,57 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import raglib.techniques as techniques
 from raglib.registry import TechniqueRegistry
 from raglib.techniques.bm25 import BM25
 
 
-def test_bm25_auto_registered():
-    registry = TechniqueRegistry.list()
+@pytest.fixture(scope="module")
+def registry():
+    return TechniqueRegistry.list()
+
+
+def test_bm25_auto_registered(registry):
     assert "bm25" in registry
-    klass = registry["bm25"]
-    assert klass is BM25
+    assert registry["bm25"] is BM25
+
+
+def test_techniques_package_lazy_attributes():
+    assert techniques.FixedSizeChunker.__name__ == "FixedSizeChunker"
+    assert "HyDE" in dir(techniques)
+    with pytest.raises(AttributeError):
+        techniques.NotATechnique  # noqa: B018
+
+
+def test_techniques_package_lazy_submodules():
+    assert techniques.bm25.BM25 is BM25
+
+
+def test_registry_loads_builtin_techniques(registry):
+    assert "fixed_size_chunker" in registry
+    assert "hyde" in registry
+
+
+def test_user_registration_overrides_builtin_name():
+    # run in a fresh interpreter so the built-ins are not loaded yet
+    code = textwrap.dedent(
+        """
+        from raglib.core import RAGTechnique, TechniqueMeta
+        from raglib.registry import TechniqueRegistry
+
+        @TechniqueRegistry.register
+        class UserBM25(RAGTechnique):
+            meta = TechniqueMeta(name="bm25", category="retrieval", description="")
+
+            def apply(self, *args, **kwargs):
+                return None
+
+        assert TechniqueRegistry.get("bm25") is UserBM25
+        assert TechniqueRegistry.list()["bm25"] is UserBM25
+        assert "fixed_size_chunker" in TechniqueRegistry.list()
+        """
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -179,7 +179,9 @@ description = "Test package"
         mock_run_command.return_value = Mock()
         result = validate_tests(dry_run=False)
         assert result is True
-        mock_run_command.assert_called_once_with(["pytest", "--tb=short", "-q"])
+        mock_run_command.assert_called_once_with(
+            ["pytest", "--tb=short", "-q"], capture_output=False, verbose=False
+        )
 
     @patch('prepare_release.run_command')
     def test_validate_tests_failure(self, mock_run_command):
@@ -5,15 +5,27 @@ This script reads registered techniques from TechniqueRegistry and creates
 a markdown file with the complete catalog of available techniques.
 """
 
+import hashlib
+import importlib
+import importlib.util
+import io
+import os
+import pkgutil
+import re
 import sys
+from collections import defaultdict, namedtuple
 from pathlib import Path
 
-# Add raglib to path
+# Add raglib to path unless this checkout's raglib is already importable
+# (editable install, or imported by the docs scripts); an installed copy
+# from elsewhere must not be documented into this checkout
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+_spec = importlib.util.find_spec("raglib")
+_origin = Path(_spec.origin).resolve() if _spec and _spec.origin else None
+if _origin is None or not _origin.is_relative_to(project_root.resolve()):
+    sys.path.insert(0, str(project_root))
 
 try:
-    from raglib.core import TechniqueMeta
     from raglib.registry import TechniqueRegistry
 except ImportError as e:
     print(f"Failed to import raglib: {e}")
@@ -21,6 +33,70 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Technique metadata with the legacy defaults filled in
+_NormMeta = namedtuple("_NormMeta", "category description version dependencies")
+
+
+def _norm_meta(technique_class) -> _NormMeta:
+    """Normalize a technique's ``meta`` (TechniqueMeta or legacy) once."""
+    meta = technique_class.meta
+    return _NormMeta(
+        getattr(meta, 'category', 'unknown'),
+        getattr(meta, 'description', 'No description available'),
+        getattr(meta, 'version', '1.0.0'),
+        tuple(getattr(meta, 'dependencies', ())),
+    )
+
+
+# Docstring usage examples per technique class, keyed by id(cls)
+_EXAMPLE_CACHE = {}
+
+# The "Example:" line, then the run of indented or blank lines after it
+_EXAMPLE_LINE = r"(?: {4}[^\n]*|[^\S\n]*(?=\n|\Z))"
+_EXAMPLE_RE = re.compile(rf"Example:[^\n]*\n({_EXAMPLE_LINE}(?:\n{_EXAMPLE_LINE})*)")
+
+
+def _extract_example(technique_class) -> tuple:
+    """Return the lines of the "Example:" block in a class docstring."""
+    key = id(technique_class)
+    cached = _EXAMPLE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    match = _EXAMPLE_RE.search(technique_class.__doc__ or "")
+    if match is None:
+        _EXAMPLE_CACHE[key] = ()
+        return ()
+    example_lines = match.group(1).split('\n')
+    
+    result = _EXAMPLE_CACHE[key] = tuple(example_lines)
+    return result
+
+
+# Registry digest of the last generated index plus the index file's
+# mtime and size at that point, stored next to it
+_HASH_FILENAME = ".techniques_index.hash"
+
+
+def _registry_digest(techniques, norm) -> str:
+    """Hash everything the index is rendered from, plus this script itself."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(Path(__file__).stat().st_mtime_ns).encode())
+    for name in sorted(techniques):
+        cls = techniques[name]
+        h.update(name.encode())
+        h.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+        h.update(repr(norm[name]).encode())
+        h.update((cls.__doc__ or "").encode())
+    return h.hexdigest()
+
+
+def _index_record(digest: str, output_file: Path) -> str:
+    """Tie a registry digest to the current state of the index file."""
+    st = output_file.stat()
+    return f"{digest} {st.st_mtime_ns} {st.st_size}"
+
+
 def generate_techniques_index():
     """Generate the techniques index markdown file."""
     techniques = TechniqueRegistry.list()
@@ -28,64 +104,60 @@ def generate_techniques_index():
     if not techniques:
         print("Warning: No techniques found in registry")
     
-    # Group techniques by category
-    categories = {}
+    # Group techniques by category as (name, class, normalized meta) records
+    norm = {name: _norm_meta(cls) for name, cls in techniques.items()}
+    categories = defaultdict(list)
     for name, technique_class in techniques.items():
-        meta = technique_class.meta
-        if isinstance(meta, TechniqueMeta):
-            category = meta.category
-            if category not in categories:
-                categories[category] = []
-            categories[category].append((name, technique_class))
-        else:
-            # Handle legacy metadata
-            category = getattr(meta, 'category', 'unknown')
-            if category not in categories:
-                categories[category] = []
-            categories[category].append((name, technique_class))
+        categories[norm[name].category].append((name, technique_class, norm[name]))
     
-    # Generate markdown content
-    content = []
+    docs_dir = project_root / "docs"
+    output_file = docs_dir / "techniques_generated.md"
+    hash_file = docs_dir / _HASH_FILENAME
+    
+    # Skip rendering entirely when nothing the index depends on has changed
+    # and the index file has not been touched since it was generated
+    digest = _registry_digest(techniques, norm)
+    try:
+        if hash_file.read_text() == _index_record(digest, output_file):
+            print(f"Techniques index unchanged: {output_file}")
+            print(f"Found {len(techniques)} techniques in {len(categories)} categories")
+            return True
+    except OSError:
+        pass
+    
+    # Generate markdown content, one block per write; every line ends in
+    # a newline
+    out = io.StringIO()
+    w = out.write
     
     # Add header
-    content.append("# Techniques Index")
-    content.append("")
-    content.append("---")
-    content.append("")
+    w("# Techniques Index\n\n---\n\n")
     
     if not categories:
-        content.append("No techniques are currently registered in the registry.")
-        content.append("")
-        content.append("To add techniques, ensure they are properly registered with:")
-        content.append("```python")
-        content.append("@TechniqueRegistry.register")
-        content.append("class YourTechnique(RAGTechnique):")
-        content.append("    meta = TechniqueMeta(...)")
-        content.append("```")
+        w("No techniques are currently registered in the registry.\n"
+          "\n"
+          "To add techniques, ensure they are properly registered with:\n"
+          "```python\n"
+          "@TechniqueRegistry.register\n"
+          "class YourTechnique(RAGTechnique):\n"
+          "    meta = TechniqueMeta(...)\n"
+          "```\n")
     else:
         # Add overview statistics
-        total_techniques = len(techniques)
-        total_categories = len(categories)
-        content.append(f"**Total Techniques:** {total_techniques}")
-        content.append(f"**Categories:** {total_categories}")
-        content.append("")
+        w(f"**Total Techniques:** {len(techniques)}\n"
+          f"**Categories:** {len(categories)}\n"
+          "\n")
         
         # Sort categories for consistent output
         category_order = [
             "chunking", "retrieval", "reranking",
             "generation", "orchestration"
         ]
-        sorted_categories = []
-        
-        # Add known categories in order
-        for cat in category_order:
-            if cat in categories:
-                sorted_categories.append(cat)
-        
-        # Add any unknown categories at the end
-        for cat in sorted(categories.keys()):
-            if cat not in sorted_categories:
-                sorted_categories.append(cat)
+        # Known categories in order, then any unknown ones alphabetically
+        rank = {cat: i for i, cat in enumerate(category_order)}
+        sorted_categories = sorted(
+            categories, key=lambda cat: (rank.get(cat, len(rank)), cat)
+        )
         
         # Generate content for each category
         for category in sorted_categories:
@@ -94,78 +166,58 @@ def generate_techniques_index():
             
             # Category header
             category_display = category.replace("_", " ").title()
-            content.append(f"### {category_display}")
-            content.append("")
+            w(f"### {category_display}\n\n")
             
             # Technique list
-            for name, technique_class in technique_list:
-                meta = technique_class.meta
-
-                # Get description
-                if isinstance(meta, TechniqueMeta):
-                    description = meta.description
-                    version = getattr(meta, 'version', '1.0.0')
-                    dependencies = getattr(meta, 'dependencies', [])
-                else:
-                    description = getattr(
-                        meta, 'description', 'No description available'
-                    )
-                    version = getattr(meta, 'version', '1.0.0')
-                    dependencies = getattr(meta, 'dependencies', [])
-
-                # Format technique entry
-                content.append(f"#### {name}")
-                content.append("")
-                content.append(f"**{description}**")
-                content.append("")
-
-                # Create info table
-                content.append("| Property | Value |")
-                content.append("|----------|-------|")
-                content.append(f"| Version | `{version}` |")
-                content.append(f"| Class | `{technique_class.__name__}` |")
-                content.append(f"| Module | `{technique_class.__module__}` |")
-
+            for name, technique_class, meta in technique_list:
+                _, description, version, dependencies = meta
                 if dependencies:
                     deps = ", ".join(f"`{dep}`" for dep in dependencies)
-                    content.append(f"| Dependencies | {deps} |")
                 else:
-                    content.append("| Dependencies | None |")
-
-                content.append("")
+                    deps = "None"
+                
+                # Format technique entry with its info table
+                w(f"#### {name}\n"
+                  "\n"
+                  f"**{description}**\n"
+                  "\n"
+                  "| Property | Value |\n"
+                  "|----------|-------|\n"
+                  f"| Version | `{version}` |\n"
+                  f"| Class | `{technique_class.__name__}` |\n"
+                  f"| Module | `{technique_class.__module__}` |\n"
+                  f"| Dependencies | {deps} |\n"
+                  "\n")
 
                 # Add usage example if available
-                doc = technique_class.__doc__
-                if doc and "Example:" in doc:
-                    # Extract example from docstring
-                    lines = doc.split('\n')
-                    in_example = False
-                    example_lines = []
-                    for line in lines:
-                        if "Example:" in line:
-                            in_example = True
-                            continue
-                        if in_example:
-                            if line.strip() and not line.startswith("    "):
-                                break
-                            example_lines.append(line)
-
-                    if example_lines:
-                        content.append("**Usage Example:**")
-                        content.append("```python")
-                        content.extend(example_lines)
-                        content.append("```")
-                        content.append("")
-
-                content.append("---")
-                content.append("")    # Write to file
-    docs_dir = project_root / "docs"
-    output_file = docs_dir / "techniques_generated.md"
+                example_lines = _extract_example(technique_class)
+                if example_lines:
+                    w("**Usage Example:**\n```python\n")
+                    out.writelines(line + "\n" for line in example_lines)
+                    w("```\n\n")
+
+                w("---\n\n")
+    
+    # The index has never ended with a newline after its last line
+    new_content = out.getvalue()[:-1]
     
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(content))
-        print(f"Generated techniques index: {output_file}")
+        # Leave an identical file untouched so incremental site builds skip it
+        try:
+            unchanged = output_file.read_text(encoding='utf-8') == new_content
+        except FileNotFoundError:
+            unchanged = False
+        
+        if unchanged:
+            print(f"Techniques index already up to date: {output_file}")
+        else:
+            # Swap in a complete file so readers never see a partial index;
+            # no fsync, the index is regenerated from the registry anyway
+            tmp_file = output_file.with_suffix(".md.tmp")
+            tmp_file.write_text(new_content, encoding='utf-8')
+            os.replace(tmp_file, output_file)
+            print(f"Generated techniques index: {output_file}")
+        hash_file.write_text(_index_record(digest, output_file))
         print(f"Found {len(techniques)} techniques in {len(categories)} categories")
         return True
     except Exception as e:
@@ -173,34 +225,32 @@ def generate_techniques_index():
         return False
 
 
-def main():
-    """Main entry point."""
+def main() -> int:
+    """Main entry point; returns the process exit status."""
     print("Generating techniques index...")
     
     # Import technique modules to ensure registration
     try:
-        # Import all technique modules to trigger registration
-        from pathlib import Path
-        
-        import raglib.techniques  # noqa: F401
-        techniques_dir = Path(__file__).parent.parent / "raglib" / "techniques"
+        # Import all technique modules to trigger registration, skipping
+        # those already imported
+        import raglib.techniques
         
-        if techniques_dir.exists():
-            for technique_file in techniques_dir.glob("*.py"):
-                if technique_file.name.startswith("__"):
-                    continue
-                module_name = f"raglib.techniques.{technique_file.stem}"
-                try:
-                    __import__(module_name)
-                except ImportError as e:
-                    print(f"Warning: Could not import {module_name}: {e}")
-                    continue
+        modules = sys.modules
+        for _, module_name, _ in pkgutil.iter_modules(
+            raglib.techniques.__path__, prefix="raglib.techniques."
+        ):
+            if module_name in modules:
+                continue
+            try:
+                importlib.import_module(module_name)
+            except ImportError as e:
+                print(f"Warning: Could not import {module_name}: {e}")
     except ImportError as e:
         print(f"Warning: Could not import techniques: {e}")
     
     success = generate_techniques_index()
-    sys.exit(0 if success else 1)
+    return 0 if success else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
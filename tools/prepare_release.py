@@ -2,22 +2,46 @@
     cmd: list[str], check: bool = True, capture_output: bool = True
 ) -> subprocess.CompletedProcess:preparation and validation tool."""
 
-import argparse
+import re
+import shutil
 import subprocess
 import sys
-from datetime import datetime
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Interpreter used to run build tooling
+_PY = sys.executable
+
 
 def run_command(
-    cmd: list[str], check: bool = True, capture_output: bool = True
+    cmd: list[str],
+    check: bool = True,
+    capture_output: bool = True,
+    verbose: bool = False,
 ) -> subprocess.CompletedProcess:
-    """Run a shell command and return result."""
-    print(f"Running: {' '.join(cmd)}")
+    """Run a command (argument list, no shell) and return result."""
+    if verbose:
+        print(f"Running: {' '.join(cmd)}")
     return subprocess.run(cmd, check=check, capture_output=capture_output, text=True)
 
 
-def validate_tests(dry_run: bool = False) -> bool:
+# CHANGELOG.md text by absolute path, line endings kept as on disk;
+# update_changelog stores its updated text here for the release notes step
+_CHANGELOG_CACHE: dict[Path, str] = {}
+
+
+def _read_changelog(path: Path) -> str:
+    """Read CHANGELOG.md once per release run."""
+    text = _CHANGELOG_CACHE.get(path)
+    if text is None:
+        with open(path, encoding="utf-8", newline="") as f:
+            text = _CHANGELOG_CACHE[path] = f.read()
+    return text
+
+
+def validate_tests(dry_run: bool = False, verbose: bool = False) -> bool:
     """Validate that all tests pass."""
     print("\n=== Validating Tests ===")
 
@@ -26,7 +50,9 @@ def validate_tests(dry_run: bool = False) -> bool:
         return True
 
     try:
-        run_command(["pytest", "--tb=short", "-q"])
+        run_command(
+            ["pytest", "--tb=short", "-q"], capture_output=False, verbose=verbose
+        )
         print("✅ All tests passed")
         return True
     except subprocess.CalledProcessError as e:
@@ -34,7 +60,7 @@ def validate_tests(dry_run: bool = False) -> bool:
         return False
 
 
-def validate_code_quality(dry_run: bool = False) -> bool:
+def validate_code_quality(dry_run: bool = False, verbose: bool = False) -> bool:
     """Validate code quality with linting tools."""
     print("\n=== Validating Code Quality ===")
 
@@ -48,16 +74,31 @@ def validate_code_quality(dry_run: bool = False) -> bool:
         (["mypy", "raglib"], "MyPy type checking")
     ]
 
-    all_passed = True
-    for cmd, description in tools:
+    def check(cmd: list[str]) -> str:
         try:
-            run_command(cmd)
-            print(f"✅ {description} passed")
+            run_command(cmd, verbose=verbose)
+            return "passed"
         except subprocess.CalledProcessError:
-            print(f"❌ {description} failed")
-            all_passed = False
+            return "failed"
         except FileNotFoundError:
-            print(f"⚠️  {description} tool not found, skipping")
+            return "missing"
+
+    # The tools share no state, so run them side by side and report as they finish
+    all_passed = True
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        futures = {
+            executor.submit(check, cmd): description for cmd, description in tools
+        }
+        for future in as_completed(futures):
+            description = futures[future]
+            outcome = future.result()
+            if outcome == "passed":
+                print(f"✅ {description} passed")
+            elif outcome == "failed":
+                print(f"❌ {description} failed")
+                all_passed = False
+            else:
+                print(f"⚠️  {description} tool not found, skipping")
 
     return all_passed
 
@@ -69,14 +110,23 @@ def get_current_version() -> str:
     if not pyproject_path.exists():
         raise FileNotFoundError("pyproject.toml not found")
 
-    with open(pyproject_path, encoding="utf-8") as f:
-        for line in f:
-            if line.strip().startswith("version = "):
-                # Extract version from 'version = "0.1.0"'
-                version = line.split("=")[1].strip().strip('"')
-                return version
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError(
+                "tomli package not found. Install with: pip install tomli"
+            ) from None
+
+    with open(pyproject_path, "rb") as f:
+        data = tomllib.load(f)
 
-    raise ValueError("Version not found in pyproject.toml")
+    try:
+        return data["project"]["version"]
+    except KeyError:
+        raise ValueError("Version not found in pyproject.toml") from None
 
 
 def update_changelog(version: str, dry_run: bool = False) -> bool:
@@ -94,8 +144,8 @@ def update_changelog(version: str, dry_run: bool = False) -> bool:
         return True
 
     # Read current changelog
-    with open(changelog_path, encoding="utf-8") as f:
-        content = f.read()
+    changelog_path = changelog_path.resolve()
+    content = _read_changelog(changelog_path)
 
     # Check if version already exists
     version_header = f"## [{version}]"
@@ -110,24 +160,26 @@ def update_changelog(version: str, dry_run: bool = False) -> bool:
         return False
 
     # Add new version section
+    from datetime import datetime
+
     today = datetime.now().strftime("%Y-%m-%d")
     new_section = f"{version_header} - {today}"
 
-    # Replace [Unreleased] with version and add new [Unreleased]
-    updated_content = content.replace(
-        unreleased_line,
-        f"{unreleased_line}\n\n{new_section}"
-    )
-
-    # Write back
-    with open(changelog_path, "w", encoding="utf-8") as f:
-        f.write(updated_content)
+    # Insert the new version under [Unreleased]. Only the text after the
+    # marker changes, so the file is rewritten in place from that offset.
+    idx = content.index(unreleased_line) + len(unreleased_line)
+    eol = "\r\n" if "\r\n" in content else "\n"
+    tail = f"{eol}{eol}{new_section}{content[idx:]}"
+    with open(changelog_path, "r+b") as f:
+        f.seek(len(content[:idx].encode("utf-8")))
+        f.write(tail.encode("utf-8"))
+    _CHANGELOG_CACHE[changelog_path] = content[:idx] + tail
 
     print(f"✅ Updated CHANGELOG.md with version {version}")
     return True
 
 
-def build_distributions(dry_run: bool = False) -> bool:
+def build_distributions(dry_run: bool = False, verbose: bool = False) -> bool:
     """Build source and wheel distributions."""
     print("\n=== Building Distributions ===")
 
@@ -135,14 +187,19 @@ def build_distributions(dry_run: bool = False) -> bool:
         print("DRY RUN: Would build source and wheel distributions")
         return True
 
-    # Clean previous builds
+    # Move previous builds aside and delete them while the build runs
     dist_path = Path("dist")
+    cleanup = None
     if dist_path.exists():
-        import shutil
-        shutil.rmtree(dist_path)
+        stale = dist_path.with_name(f"dist.old-{uuid.uuid4().hex}")
+        dist_path.rename(stale)
+        cleanup = threading.Thread(
+            target=shutil.rmtree, args=(stale,), kwargs={"ignore_errors": True}
+        )
+        cleanup.start()
 
     try:
-        run_command([sys.executable, "-m", "build"])
+        run_command([_PY, "-m", "build"], verbose=verbose)
         print("✅ Built distributions successfully")
 
         # List built files
@@ -154,6 +211,10 @@ def build_distributions(dry_run: bool = False) -> bool:
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
         return False
+    finally:
+        # Never leave a dist.old-* directory behind
+        if cleanup is not None:
+            cleanup.join()
 
 
 def create_draft_release_notes(version: str, dry_run: bool = False) -> bool:
@@ -172,8 +233,7 @@ def create_draft_release_notes(version: str, dry_run: bool = False) -> bool:
         print("❌ CHANGELOG.md not found")
         return False
 
-    with open(changelog_path, encoding="utf-8") as f:
-        content = f.read()
+    content = _read_changelog(changelog_path.resolve()).replace("\r\n", "\n")
 
     # Find version section
     version_header = f"## [{version}]"
@@ -181,27 +241,19 @@ def create_draft_release_notes(version: str, dry_run: bool = False) -> bool:
         print(f"❌ Version {version} not found in CHANGELOG.md")
         return False
 
-    # Extract section between this version and next version/section
-    lines = content.split("\n")
-    start_idx = None
-    end_idx = None
-
-    for i, line in enumerate(lines):
-        if line.startswith(version_header):
-            start_idx = i
-        elif start_idx is not None and line.startswith("## [") and i > start_idx:
-            end_idx = i
-            break
-
-    if start_idx is None:
+    # Extract section between this version and the next version/section
+    section_re = re.compile(
+        rf"^{re.escape(version_header)}.*?(?=^## \[|\Z)", re.S | re.M
+    )
+    match = section_re.search(content)
+    if match is None:
         print(f"❌ Could not find version {version} in CHANGELOG.md")
         return False
 
-    # Get content for this version
-    if end_idx is None:
-        version_content = "\n".join(lines[start_idx:])
-    else:
-        version_content = "\n".join(lines[start_idx:end_idx])
+    # Drop the newline that separates this section from the next header
+    version_content = match.group(0)
+    if match.end() < len(content):
+        version_content = version_content[:-1]
 
     # Create release notes
     release_notes = f"""# RAGLib {version}
@@ -228,16 +280,18 @@ pip install rag-techlib=={version}
     return True
 
 
-def validate_git_state() -> bool:
+def validate_git_state(verbose: bool = False) -> bool:
     """Validate git repository state."""
     print("\n=== Validating Git State ===")
 
     try:
         # Check if we're in a git repo
-        run_command(["git", "status"], capture_output=True)
+        run_command(["git", "status"], capture_output=True, verbose=verbose)
 
         # Check for uncommitted changes
-        result = run_command(["git", "status", "--porcelain"], capture_output=True)
+        result = run_command(
+            ["git", "status", "--porcelain"], capture_output=True, verbose=verbose
+        )
         if result.stdout.strip():
             print("⚠️  Uncommitted changes found:")
             print(result.stdout)
@@ -253,6 +307,8 @@ def validate_git_state() -> bool:
 
 def main():
     """Main entry point for release preparation."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Prepare RAGLib release")
     parser.add_argument("--dry-run", action="store_true",
                        help="Run validations without making changes")
@@ -261,6 +317,8 @@ def main():
                        help="Skip test validation")
     parser.add_argument("--skip-quality", action="store_true",
                        help="Skip code quality validation")
+    parser.add_argument("--verbose", action="store_true",
+                       help="Echo each command before running it")
 
     args = parser.parse_args()
 
@@ -282,18 +340,18 @@ def main():
     success = True
 
     # Validate git state
-    if not validate_git_state():
+    if not validate_git_state(args.verbose):
         print("⚠️  Git validation failed, continuing anyway...")
 
     # Run tests
     if not args.skip_tests:
-        if not validate_tests(args.dry_run):
+        if not validate_tests(args.dry_run, args.verbose):
             print("❌ Test validation failed")
             success = False
 
     # Run code quality checks
     if not args.skip_quality:
-        if not validate_code_quality(args.dry_run):
+        if not validate_code_quality(args.dry_run, args.verbose):
             print("❌ Code quality validation failed")
             success = False
 
@@ -307,7 +365,7 @@ def main():
         return 1
 
     # Build distributions
-    if not build_distributions(args.dry_run):
+    if not build_distributions(args.dry_run, args.verbose):
         print("❌ Distribution build failed")
         return 1
 